@@ -10,7 +10,12 @@ Activity detection priority:
 """
 
 from __future__ import absolute_import, print_function, unicode_literals
+import array
+import contextlib
+import functools
 import re
+from collections import defaultdict
+from enum import IntEnum
 import time
 import Live
 from _Framework.ControlSurface import ControlSurface
@@ -19,6 +24,55 @@ from . import config
 VERSION = "3.0.0"  # Major: Smart page filling - |1-|8 priority + | tracks as filler
 
 
+class CType(IntEnum):
+    """Control types (per-slot controls, flat index = slot * NUM_CTYPES + ctype)"""
+    FADER = 0       # Fader → Macro 1
+    POT_TOP = 1     # Top pot → Macro 2
+    POT_BOTTOM = 2  # Bottom pot → Macro 3
+
+
+CTYPES = tuple(CType)  # Members in index order (iterating the enum builds a generator each time)
+NUM_CTYPES = len(CTYPES)
+NUM_CONTROLS = 12 * NUM_CTYPES
+CTYPE_NAMES = ('fader', 'pot_top', 'pot_bottom')  # For log messages only
+CTYPE_CC_BASE = (48, 0, 12)  # CC of slot 0 for each control type
+
+MIDI_UNSET = 255     # _control_midi_values sentinel: control never touched
+PICKUP_UNSET = -1.0  # _control_values sentinel: not picked up yet
+
+# Track name suffix: '|' (fill group 0) or '|N' (group N)
+GROUP_RE = re.compile(r'\|(\d+)?$')
+
+ALL_CCS = tuple(range(61))  # CC 0-60 forwarded to receive_midi()
+RED_LED_CCS = tuple(range(24, 36))  # Slot → red (activity) LED CC
+GREEN_LED_CCS = tuple(range(36, 48))  # Slot → green (page/pins) LED CC
+
+# Inbound CC number → region index into the handler tuple (see _build_cc_dispatch)
+# 0: Pots top, 1: Pots bottom, 2: Red buttons, 3: Page buttons,
+# 4: Function buttons, 5: Faders, 6: Encoder, 7: Unassigned
+CC_REGION = bytes([0] * 12 + [1] * 12 + [2] * 12 + [3] * 8 + [4] * 4 + [5] * 12 + [6] + [7] * 67)
+
+# Inbound control CC → flat control index (slot * NUM_CTYPES + ctype), 255 elsewhere
+CC_CONTROL_INDEX = bytearray([255] * 128)
+for _ctype, _base in enumerate(CTYPE_CC_BASE):
+    for _slot in range(12):
+        CC_CONTROL_INDEX[_base + _slot] = _slot * NUM_CTYPES + _ctype
+CC_CONTROL_INDEX = bytes(CC_CONTROL_INDEX)
+del _ctype, _base, _slot
+
+# Blink phase durations in seconds (ON, OFF), driven by deadlines in update_display
+BLINK_FAST_TIMES = (0.3, 0.1)       # 2.5Hz, 75/25: pinned slot not on current page
+BLINK_SLOW_TIMES = (0.9, 0.1)       # 1Hz, 90/10: current page + pinned
+BLINK_INDICATOR_TIMES = (0.1, 0.1)  # 50/50: recording / snapshot indicator on slot 11
+
+# Inbound MIDI debug logging, bound once at import (no per-message config lookup)
+DEBUG_MIDI = config.LOG_MIDI_RECEIVE
+# Per-slot activity LED detail logging (see _force_activity_led_update)
+DEBUG_VU = config.LOG_VU_DETAIL
+# Per-event M4L activity logging (see _on_m4l_param_change)
+DEBUG_M4L = config.LOG_PARAM_CHANGES
+
+
 class FaderfoxMX12byYVMA(ControlSurface):
     """Listener-based Control Surface for Faderfox MX12"""
 
@@ -32,35 +86,66 @@ class FaderfoxMX12byYVMA(ControlSurface):
         self.NUM_PAGES = 8
         self.NUM_FUNCTIONS = 4
 
+        # Live song (one per script instance: Live re-creates the script on set load)
+        self._song = self.song()
+        # Recording capabilities, probed once instead of on every CC 47 press
+        self._caps_arr_overdub = hasattr(self._song, 'arrangement_overdub')
+        self._caps_automation_record = hasattr(self._song, 'session_automation_record')
+        self._caps_record_mode = hasattr(self._song, 'record_mode')
+
         # Groups and pages (Phase 1)
         self._track_groups = {}  # {group_id: [tracks...]}
         self._all_tracks_padded = []  # Linear list with None for padding
         self._page_start_positions = []  # Start position of each page in _all_tracks_padded
+        self._track_run_lengths = array.array('H')  # Per _all_tracks_padded index: tracks until next None/end
         self._current_page = 0  # Current page for LED display (0-7)
         self._scroll_offset = 0  # Track offset for track-by-track scrolling (Phase 4)
         self._page_scroll_offset = 0  # LOCAL scroll within current page (respects locks)
+        self._track_layout = None  # (id(track), group_id) of MX12 tracks at last scan
 
         # Legacy (will be removed)
         self._filtered_tracks = []
 
-        # Mappings
-        self._mapped_params = {}
+        # Mappings (flat SoA layout: index = slot * NUM_CTYPES + ctype)
+        self._mapped_params = [None] * NUM_CONTROLS
+        # Range of each mapped param, captured in _map_track (no per-event min/max reads)
+        self._param_min = array.array('d', [0.0]) * NUM_CONTROLS
+        self._param_range = array.array('d', [0.0]) * NUM_CONTROLS
+        # CC number for each flat index (fader CC 48+, pot top CC 0+, pot bottom CC 12+)
+        self._cc_for_slot_ctype = [CTYPE_CC_BASE[c] + t for t in range(12) for c in range(NUM_CTYPES)]
 
         # Virtual page tracks (tracks added to virtual page, shown in PINS mode)
         # Changed from dict to list to preserve order and avoid slot index conflicts
         self._pinned_tracks = []  # List of track objects in order of addition
+        self._pinned_track_ids = set()  # id(track) of pinned tracks, O(1) membership test
+
+        # Cached views (see _build_virtual_track_list / _page_window / _current_page_window)
+        self._virtual_tracks_cache = None
+        self._virtual_tracks_key = None  # (display_mode, scroll_offset, page_scroll_offset)
+        self._virtual_tracks_dirty = True  # Set when pins or track list change
+        self._page_window_cache = None
+        self._page_window_key = None  # (scroll_offset, page_scroll_offset), None = invalid
+        self._pins_window_cache = None
+        self._pins_window_source = None  # Virtual list the PINS window was sliced from
+        self._visible_tracks_cache = None  # [(slot_idx, track), ...] for non-empty slots
+        self._visible_tracks_source = None  # Slot window the cache was built from
+        self._pinned_mask_cache = 0  # Bit i set = page window slot i holds a pinned track
+        self._pinned_mask_source = None  # Page window the mask was built from, None = invalid
 
         # Display mode (Phase X - Simplified pins view)
         self._display_mode = 'page'  # 'page' or 'pins'
-        self._last_cc45_press_time = 0  # For double-tap detection on CC 45 (PIN)
-        self._last_cc47_press_time = 0  # For double-tap detection on CC 47 (RECORD)
+        self._last_cc45_press_time = 0  # time.monotonic() of last CC 45 press (PIN double-tap)
+        self._last_cc47_press_time = 0  # time.monotonic() of last CC 47 press (RECORD double-tap)
+
+        # Inbound MIDI debug logging (see DEBUG_MIDI)
+        self._midi_debug_count = 0  # Messages logged so far (capped at 100)
 
         # Encoder state (for absolute mode 0-127)
         self._last_encoder_value = None  # Track last encoder value to detect direction
 
         # Scroll position indicator (visual feedback when scrolling)
         self._scroll_indicator_active = False  # True when showing scroll position
-        self._scroll_indicator_end_time = 0  # Time when indicator should turn off
+        self._scroll_indicator_end_time = 0  # time.monotonic() when indicator should turn off
 
         # Function buttons state (Phase 3 - momentary mode)
         # Note: _select_mode removed - track selection is now the default behavior for red buttons
@@ -69,47 +154,68 @@ class FaderfoxMX12byYVMA(ControlSurface):
         self._recording_mode = False  # CC 47 - Recording toggle mode (arrangement + automation)
 
         # Snapshots (Phase 6) - Toggle mode
-        self._snapshot_backup = {}  # Snapshot backup, active while _snapshot_mode = True
+        self._snapshot_backup = None  # bytearray snapshot of _control_midi_values, active while _snapshot_mode = True
 
         # LEDs
-        self._led_states = [0] * 12  # Red (activity)
-        self._page_led_states = [0] * 12  # Green (page/pins)
+        self._led_states = bytearray(12)  # Red (activity)
+        self._page_led_states = bytearray(12)  # Green (page/pins)
         self._midi_channel = 0
-
-        # Blink counters for green LEDs (pins visualization)
+        self._cc_status = 0xB0 | self._midi_channel  # Pre-built Control Change status byte
+        # Pre-built (status, cc, value) tuples for the LED values 0 (OFF) and 127 (ON),
+        # indexed [value][cc_num]; other values are built per send (see _cc)
+        self._cc_msg_table = [None] * 128
+        for value in (0, 127):
+            self._cc_msg_table[value] = tuple((self._cc_status, cc_num, value) for cc_num in range(128))
+
+        # Blink states for green LEDs (pins visualization), toggled at deadlines
         # Fast: 2.5Hz (75% ON, 25% OFF) pour pinned seul - attire attention
         # Slow: 1Hz (90% ON, 10% OFF) pour page + pinned - moins dérangeant
-        self._blink_fast_counter = 0  # 2.5Hz for pinned slots (not on current page)
+        now = time.monotonic()
         self._blink_fast_state = True  # True = ON (75%), False = OFF (25%)
-        self._blink_slow_counter = 0  # 1Hz for page + pinned (double function)
+        self._blink_fast_deadline = now + BLINK_FAST_TIMES[0]  # time.monotonic() of next toggle
         self._blink_slow_state = True  # True = ON (90%), False = OFF (10%)
+        self._blink_slow_deadline = now + BLINK_SLOW_TIMES[0]
 
-        # Recording LED blink (red, slot 11) - 4Hz rapid blink
-        self._recording_blink_counter = 0  # 4Hz for recording indicator
+        # Recording LED blink (red, slot 11) - rapid 50/50 blink
         self._recording_blink_state = True  # True = ON, False = OFF
+        self._recording_blink_deadline = now + BLINK_INDICATOR_TIMES[0]
         self._recording_led_slot = 11  # Use slot 11 (CC 35 red, CC 47 green) for indicators
 
-        # Snapshot LED blink (green, slot 11) - same 4Hz rapid blink
-        self._snapshot_blink_counter = 0  # 4Hz for snapshot indicator
+        # Snapshot LED blink (green, slot 11) - same rapid blink
         self._snapshot_blink_state = True  # True = ON, False = OFF
+        self._snapshot_blink_deadline = now + BLINK_INDICATOR_TIMES[0]
 
         # Pickup mode tracking
         self.PICKUP_THRESHOLD = 0.02  # 2% tolerance for pickup
-        self._control_values = {}  # (track_idx, control_type) -> normalized value (0.0-1.0)
-        self._control_midi_values = {}  # (track_idx, control_type) -> MIDI value (0-127) for snapshots
+        self._control_values = array.array('f', [PICKUP_UNSET]) * NUM_CONTROLS  # normalized value (0.0-1.0), PICKUP_UNSET = not picked up
+        self._control_midi_values = bytearray([MIDI_UNSET]) * NUM_CONTROLS  # MIDI value (0-127) for snapshots, MIDI_UNSET = never set
+        self._last_in_midi_value = bytearray([MIDI_UNSET]) * 128  # last incoming value per CC, written only by _handle_control
 
         # Listeners tracking
-        self._active_listeners = {}  # (track_idx, listener_type) -> (listener_function, track_object)
-        self._param_listeners = {}  # (track_idx, control_type) -> listener_function
-        self._suspended_listeners = {}  # Temporary storage for suspended param listeners during bulk operations
+        self._active_listeners = {}  # (track_idx, listener_type) -> (listener_function, track_object, m4l_param or None)
+        # Per-slot activity callbacks, built once: same identity on every page change
+        self._vu_callbacks = [functools.partial(self._on_vu_meter_change, i) for i in range(12)]
+        self._m4l_callbacks = [functools.partial(self._on_m4l_param_change, i) for i in range(12)]
+        self._m4l_params = [None] * 12  # slot -> midi_active param read by its M4L callback
+        self._param_listeners = [None] * NUM_CONTROLS  # flat index -> listener_function
+        self._suspended_listeners = {}  # flat index -> (listener, param), temporary storage for suspended param listeners during bulk operations
+        self._automation_listeners = [None] * NUM_CONTROLS  # flat index -> automation_state listener
+        self._automated_params = set()  # flat indices of mapped params that may have automation
+        self._feedback_dirty = bytearray(NUM_CONTROLS)  # flat index -> 1 if param changed since last flush
+        self._feedback_pending = False  # Any _feedback_dirty entry set, flushed in update_display
+        self._vu_dirty = bytearray(12)  # slot -> 1 if its VU meter changed since last poll
+        self._vu_pending = False  # Any _vu_dirty entry set, polled in update_display
+        self._m4l_device_cache = {}  # id(track) -> M4L device or None (see _find_m4l_device)
+        self._is_audio_cache = {}  # id(track) -> has VU meters (see _is_audio_track), same lifetime
 
         # CPU Optimization: Throttle LED resync to prevent spam
-        self._last_resync_time = 0
-        self._resync_cooldown = 0.05  # 50ms cooldown between resyncs
+        self._last_resync_time = 0  # time.monotonic() of last resync
+        self._resync_cooldown = config.LED_RESYNC_COOLDOWN  # 50ms cooldown between resyncs
+        self._pending_resync = False  # Resync skipped by throttle, flushed in update_display
+        self._leds_dirty = False  # Mode/page/pin/snapshot/recording changed since last LED update
 
-        # CPU Optimization: Skip update_display if blink states unchanged
-        self._prev_blink_fast_state = True
-        self._prev_blink_slow_state = True
+        # Inbound CC region handlers (indexed by CC_REGION)
+        self._cc_region_handlers = self._build_cc_dispatch()
 
         # Setup
         self._scan_tracks()
@@ -120,16 +226,14 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
         # Activity LEDs (red, CC 24-35) - all OFF
         for i in range(12):
-            self._send_midi((0xB0 | self._midi_channel, 24 + i, 0))
-            self._led_states[i] = 0
+            self._send_cc_if_changed(self._led_states, i, RED_LED_CCS[i], 0, force=True)
 
         # Page LEDs (green, CC 36-47) - all OFF except current page
         # Hardware now correctly responds: 127=ON, 0=OFF
         for i in range(12):
             value = 127 if i == self._current_page else 0
-            self._send_midi((0xB0 | self._midi_channel, 36 + i, value))
-            self._page_led_states[i] = value
-            self.log_message(f"Init: CC {36+i} = {value} (page {i}, current={self._current_page})")
+            self._send_cc_if_changed(self._page_led_states, i, GREEN_LED_CCS[i], value, force=True)
+            self.log_message(f"Init: CC {GREEN_LED_CCS[i]} = {value} (page {i}, current={self._current_page})")
 
         self.log_message(f"Faderfox MX12 v{VERSION} - Ready! Found {len(self._filtered_tracks)} tracks")
         self.show_message(f"Faderfox MX12 v{VERSION} - Ready!")
@@ -154,8 +258,15 @@ class FaderfoxMX12byYVMA(ControlSurface):
         pass
 
     def build_midi_map(self, midi_map_handle):
-        """Register MIDI CCs to receive via receive_midi()"""
+        """Register MIDI CCs to receive via receive_midi()
+
+        Always forwards: every call gets a freshly allocated map, which may
+        reuse the address of the previous one.
+        """
+        # Bind the C bridge call and arguments to locals for the loop
         script_handle = self._c_instance.handle()
+        forward_midi_cc = Live.MidiMap.forward_midi_cc
+        channel = self._midi_channel
 
         # Forward all CCs from Faderfox to receive_midi()
         # CC 0-11: Pots top
@@ -164,8 +275,8 @@ class FaderfoxMX12byYVMA(ControlSurface):
         # CC 36-47: Page buttons (green)
         # CC 48-59: Faders
         # CC 60: Encoder
-        for cc_num in range(61):  # 0-60
-            Live.MidiMap.forward_midi_cc(script_handle, midi_map_handle, self._midi_channel, cc_num)
+        for cc_num in ALL_CCS:
+            forward_midi_cc(script_handle, midi_map_handle, channel, cc_num)
 
         self.log_message("MIDI map built: forwarding CC 0-60 to receive_midi()")
 
@@ -179,86 +290,91 @@ class FaderfoxMX12byYVMA(ControlSurface):
         data1 = midi_bytes[1]
         data2 = midi_bytes[2]
 
+        # DEBUG_MIDI is a module constant: a single global load when disabled
+        if DEBUG_MIDI:
+            self._log_midi_receive(status, data1, data2)
+
+        # Control Change on our channel: one compare against the pre-built status byte
+        if status == self._cc_status:
+            self._handle_cc(data1, data2)
+
+    def _log_midi_receive(self, status, data1, data2):
+        """DEBUG: Log incoming MIDI (first 100 messages + wrong channel + every CC)"""
         msg_type = status & 0xF0
         channel = status & 0x0F
 
-        # DEBUG: Log ALL incoming MIDI (first 100 messages)
-        if not hasattr(self, '_midi_debug_count'):
-            self._midi_debug_count = 0
         if self._midi_debug_count < 100:
             self.log_message(f"MIDI RX: status={status:02X} data1={data1} data2={data2} | msg_type={msg_type:02X} channel={channel}")
             self._midi_debug_count += 1
 
         if channel != self._midi_channel:
             self.log_message(f"MIDI IGNORED: wrong channel (got {channel}, expected {self._midi_channel})")
-            return
-
-        if msg_type == 0xB0:  # Control Change
+        elif msg_type == 0xB0:  # Control Change
             self.log_message(f"CC received: CC{data1}={data2}")
-            self._handle_cc(data1, data2)
-
-    def _handle_cc(self, cc_num, value):
-        # Red buttons (CC 24-35) - NEW: select track by default, pin when CC 45 held
-        if 24 <= cc_num <= 35:
-            slot_idx = cc_num - 24
-
-            if value > 0:  # Press
-                self._force_resync_all_leds()
-
-                # Check which function mode is active
-                if self._pin_mode:
-                    # PIN mode (CC 45 held): pin/unpin slot
-                    self._toggle_pin(slot_idx)
-                else:
-                    # DEFAULT behavior: select track in Ableton
-                    self._select_track(slot_idx)
-            else:  # Release
-                self._force_resync_all_leds()
 
-        # Page buttons (CC 36-43) - 8 pages
-        elif 36 <= cc_num <= 43:
-            if value > 0:
-                # Resync ALL LEDs on press
-                self._force_resync_all_leds()
-
-                page_idx = cc_num - 36
-
-                # Special behavior in PINS mode
-                if self._display_mode == 'pins':
-                    # Exit PINS mode and go to this page
-                    self._display_mode = 'page'
-                    self._change_page(page_idx)
-                    self.show_message("View: PAGE {} (exited pins)".format(page_idx + 1))
-                    self.log_message("Exited PINS mode via page button press (CC {})".format(cc_num))
-                else:
-                    # Normal page change
-                    self._change_page(page_idx)
-            else:
-                # Button released - resync ALL LEDs again
-                self._force_resync_all_leds()
+    def _build_cc_dispatch(self):
+        """Build the region → handler(cc_num, value) tuple of bound methods
 
-        # Function buttons (CC 44-47) - Phase 3 momentary modes
-        elif 44 <= cc_num <= 47:
-            self._force_resync_all_leds()
-            self._handle_function_button(cc_num, value)
+        Order matches CC_REGION: CC 0-11: Pots top, CC 12-23: Pots bottom,
+        CC 24-35: Red buttons, CC 36-43: Page buttons, CC 44-47: Function
+        buttons, CC 48-59: Faders, CC 60: Encoder, CC 61-127: Unassigned.
+        """
+        return (
+            self._handle_control,  # Pots top
+            self._handle_control,  # Pots bottom
+            self._handle_red_button,
+            self._handle_page_button,
+            self._handle_function_button,
+            self._handle_control,  # Faders
+            self._handle_encoder_scroll,
+            self._handle_unassigned_cc,
+        )
 
-        # Faders (CC 48-59)
-        elif 48 <= cc_num <= 59:
-            self._handle_fader(cc_num - 48, value)
+    def _handle_cc(self, cc_num, value):
+        # One byte lookup + one indexed call, no range tests
+        self._cc_region_handlers[CC_REGION[cc_num]](cc_num, value)
 
-        # Pots top (CC 0-11)
-        elif 0 <= cc_num <= 11:
-            self._handle_pot_top(cc_num, value)
+    def _handle_unassigned_cc(self, cc_num, value):
+        """CC 61-127 - not used by the MX12 layout"""
+        pass
 
-        # Pots bottom (CC 12-23)
-        elif 12 <= cc_num <= 23:
-            self._handle_pot_bottom(cc_num - 12, value)
+    # === CONTROL HANDLERS ===
 
-        # Encoder scroll (CC 60)
-        elif cc_num == 60:
-            self._handle_encoder_scroll(value)
+    def _handle_red_button(self, cc_num, value):
+        """Red buttons (CC 24-35) - select track by default, pin when CC 45 held"""
+        slot_idx = cc_num - 24
+        if value > 0:  # Press
+            self._force_resync_all_leds(pressed_cc=cc_num)
 
-    # === CONTROL HANDLERS ===
+            # Check which function mode is active
+            if self._pin_mode:
+                # PIN mode (CC 45 held): pin/unpin slot
+                self._toggle_pin(slot_idx)
+            else:
+                # DEFAULT behavior: select track in Ableton
+                self._select_track(slot_idx)
+        # Release: no resync, button-up never changes LED target state
+
+    def _handle_page_button(self, cc_num, value):
+        """Page buttons (CC 36-43) - 8 pages"""
+        page_idx = cc_num - 36
+        if value > 0:
+            # Resync ALL LEDs on press
+            self._force_resync_all_leds(pressed_cc=cc_num)
+
+            # Special behavior in PINS mode
+            if self._display_mode == 'pins':
+                # Exit PINS mode and go to this page
+                self._display_mode = 'page'
+                self._change_page(page_idx)
+                self.show_message("View: PAGE {} (exited pins)".format(page_idx + 1))
+                self.log_message("Exited PINS mode via page button press (CC {})".format(cc_num))
+            else:
+                # Normal page change
+                self._change_page(page_idx)
+        else:
+            # Button released - resync ALL LEDs again
+            self._force_resync_all_leds(pressed_cc=cc_num)
 
     def _handle_function_button(self, cc_num, value):
         """Handle function buttons (CC 45-47)
@@ -276,10 +392,13 @@ class FaderfoxMX12byYVMA(ControlSurface):
           - Single tap: Stop recording + Re-enable automations
           - Double tap: Start recording (overdub + automation ARM)
         """
+        # Resync ALL LEDs on press and release (Phase 3 momentary modes)
+        self._force_resync_all_leds(pressed_cc=cc_num)
+
         if cc_num == 45:  # PIN mode + DOUBLE-TAP for display mode toggle
             if value > 0:
                 # Check for double-tap (< 300ms between presses)
-                now = time.time()
+                now = time.monotonic()
                 time_since_last_press = now - self._last_cc45_press_time
 
                 if time_since_last_press < 0.3:
@@ -308,7 +427,7 @@ class FaderfoxMX12byYVMA(ControlSurface):
         elif cc_num == 47:  # RECORDING with double-tap detection
             if value > 0:  # Only trigger on press
                 # Check for double-tap (< 300ms between presses)
-                now = time.time()
+                now = time.monotonic()
                 time_since_last_press = now - self._last_cc47_press_time
 
                 if time_since_last_press < 0.3:
@@ -331,25 +450,14 @@ class FaderfoxMX12byYVMA(ControlSurface):
         """
         track = None
 
-        if self._display_mode == 'pins':
-            # PINS MODE: Get track from virtual page
-            virtual_tracks = self._build_virtual_track_list()
-            start_idx = self._page_scroll_offset
-            visible_tracks = virtual_tracks[start_idx:start_idx + self.NUM_TRACKS]
-
-            if slot_idx < len(visible_tracks):
-                track = visible_tracks[slot_idx]
-        else:
-            # PAGE MODE: Get track from current page only
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
-
-            if slot_idx < len(page_tracks):
-                track = page_tracks[slot_idx]
+        # Current page tracks (PAGE mode) or virtual page tracks (PINS mode)
+        slot_tracks = self._current_page_window()
+        if slot_idx < len(slot_tracks):
+            track = slot_tracks[slot_idx]
 
         if track is not None:
             # Select track in Live
-            self.song().view.selected_track = track
+            self._song.view.selected_track = track
             self.show_message("Selected: {}".format(track.name))
             self.log_message("Selected track: {} (slot {})".format(track.name, slot_idx))
         else:
@@ -368,38 +476,33 @@ class FaderfoxMX12byYVMA(ControlSurface):
         # Get current track in this slot
         track = None
 
-        if self._display_mode == 'pins':
-            # In PINS mode, get track from virtual list
-            virtual_tracks = self._build_virtual_track_list()
-            start_idx = self._page_scroll_offset
-            visible_tracks = virtual_tracks[start_idx:start_idx + self.NUM_TRACKS]
-
-            if slot_idx < len(visible_tracks):
-                track = visible_tracks[slot_idx]
-        else:
-            # In PAGE mode, get track from current page
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
-
-            if slot_idx < len(page_tracks):
-                track = page_tracks[slot_idx]
+        # Current page tracks (PAGE mode) or virtual list tracks (PINS mode)
+        slot_tracks = self._current_page_window()
+        if slot_idx < len(slot_tracks):
+            track = slot_tracks[slot_idx]
 
         if track is None:
             self.show_message("Slot {} empty, cannot toggle".format(slot_idx + 1))
             return
 
         # Toggle track in/out of virtual page list
-        if track in self._pinned_tracks:
+        track_id = id(track)
+        if track_id in self._pinned_track_ids:
             # Remove from virtual page
+            self._pinned_track_ids.discard(track_id)
             self._pinned_tracks.remove(track)
             self.show_message("Unpinned: {}".format(track.name))
             self.log_message("Unpinned: {}".format(track.name))
         else:
             # Add to virtual page
+            self._pinned_track_ids.add(track_id)
             self._pinned_tracks.append(track)
             self.show_message("Pinned: {}".format(track.name))
             self.log_message("Pinned: {} (total: {})".format(track.name, len(self._pinned_tracks)))
 
+        self._virtual_tracks_dirty = True
+        self._pinned_mask_source = None
+        self._leds_dirty = True
         self._update_activity_listeners()
 
     def _start_recording(self):
@@ -414,24 +517,26 @@ class FaderfoxMX12byYVMA(ControlSurface):
             return
 
         # START RECORDING
+        song = self._song
         try:
             # 1. Enable MIDI Arrangement Overdub
-            if hasattr(self.song(), 'arrangement_overdub'):
-                self.song().arrangement_overdub = True
+            if self._caps_arr_overdub:
+                song.arrangement_overdub = True
                 self.log_message("Enabled: Arrangement Overdub")
 
             # 2. Enable Automation ARM
-            if hasattr(self.song(), 'session_automation_record'):
-                self.song().session_automation_record = True
+            if self._caps_automation_record:
+                song.session_automation_record = True
                 self.log_message("Enabled: Automation ARM")
 
             # 3. Start recording
-            if hasattr(self.song(), 'record_mode'):
-                self.song().record_mode = True
+            if self._caps_record_mode:
+                song.record_mode = True
                 self.log_message("Enabled: Record Mode")
 
             # Set flag and show message
             self._recording_mode = True
+            self._leds_dirty = True
             self.show_message("RECORDING STARTED")
             self.log_message("Recording mode: ON (Overdub + Automation ARM + Record)")
 
@@ -452,18 +557,18 @@ class FaderfoxMX12byYVMA(ControlSurface):
         if self._recording_mode:
             try:
                 # Stop record mode
-                if hasattr(self.song(), 'record_mode'):
-                    self.song().record_mode = False
+                if self._caps_record_mode:
+                    self._song.record_mode = False
                     self.log_message("Disabled: Record Mode")
 
                 # Set flag
                 self._recording_mode = False
+                self._leds_dirty = True
                 self.log_message("Recording mode: OFF")
 
                 # Turn off recording LED immediately
-                cc_num = 24 + self._recording_led_slot
-                self._send_midi((0xB0 | self._midi_channel, cc_num, 0))
-                self._led_states[self._recording_led_slot] = 0
+                cc_num = RED_LED_CCS[self._recording_led_slot]
+                self._send_cc_if_changed(self._led_states, self._recording_led_slot, cc_num, 0)
 
             except Exception as e:
                 self.show_message("ERROR: Could not stop recording")
@@ -487,19 +592,20 @@ class FaderfoxMX12byYVMA(ControlSurface):
             # ACTIVATE SNAPSHOT - backup current state
             self._backup_current_state()
             self._snapshot_mode = True
+            self._leds_dirty = True
             self.show_message("SNAPSHOT: Active (controls backed up)")
             self.log_message("Snapshot mode: ON - Controls backed up, will restore on toggle")
         else:
             # DEACTIVATE SNAPSHOT - restore backup
             self._restore_backup()
             self._snapshot_mode = False
+            self._leds_dirty = True
             self.show_message("SNAPSHOT: Restored")
             self.log_message("Snapshot mode: OFF - Backup restored")
 
             # Turn off snapshot LED immediately
-            cc_num = 36 + self._recording_led_slot  # Green LED = CC 47
-            self._send_midi((0xB0 | self._midi_channel, cc_num, 0))
-            self._page_led_states[self._recording_led_slot] = 0
+            cc_num = GREEN_LED_CCS[self._recording_led_slot]  # Green LED = CC 47
+            self._send_cc_if_changed(self._page_led_states, self._recording_led_slot, cc_num, 0)
 
     def _toggle_display_mode(self):
         """Toggle between PAGE and PINS display mode (double-tap CC 45)
@@ -515,10 +621,6 @@ class FaderfoxMX12byYVMA(ControlSurface):
         - Green LED CC 45 (slot 9) FIXED ON to indicate PINS mode
         - Encoder scrolls through pinned tracks if > 12
         """
-        # CRITICAL: Invalidate LED cache to force resend
-        # Use values opposite to what we want to ensure MIDI is sent
-        self._page_led_states = [127] * 12  # Invalidate with opposite values
-
         if self._display_mode == 'page':
             # Switch to PINS mode
             self._display_mode = 'pins'
@@ -533,11 +635,10 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
         # Reset scroll offset when switching modes
         self._page_scroll_offset = 0
+        self._leds_dirty = True
 
-        # Force LED resync and remap
-        # Bypass throttle by resetting last resync time
-        self._last_resync_time = 0
-        self._force_resync_all_leds()
+        # Force LED resync and remap (bypass throttle)
+        self._force_resync_all_leds(force=True)
         self._map_current_page()
 
         # CRITICAL: Update green LEDs immediately after mode switch
@@ -546,59 +647,52 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
     def _backup_current_state(self):
         """Backup current control positions (toggle snapshot mode)"""
-        self._snapshot_backup = {}
-
-        # Copy all current control MIDI values
-        for key, midi_value in self._control_midi_values.items():
-            self._snapshot_backup[key] = midi_value
+        # Copy all current control MIDI values (flat slot*3 + ctype layout)
+        self._snapshot_backup = bytearray(self._control_midi_values)
 
-        num_controls = len(self._snapshot_backup)
+        num_controls = NUM_CONTROLS - self._snapshot_backup.count(MIDI_UNSET)
         self.log_message("Snapshot backup: {} controls backed up".format(num_controls))
 
     def _restore_backup(self):
         """Restore backup values (toggle snapshot mode) - NO automation re-enable"""
-        if not self._snapshot_backup:
+        if self._snapshot_backup is None:
             self.log_message("No backup to restore")
             return
 
-        # Suspend param listeners to prevent callback flood (if enabled in config)
-        if config.SUSPEND_LISTENERS_DURING_RESTORE:
-            self._suspend_param_listeners()
-
-        # Restore all backup values
-        for (track_idx, control_type), midi_value in self._snapshot_backup.items():
-            # Determine CC number based on control type
-            if control_type == 'fader':
-                cc_num = 48 + track_idx
-            elif control_type == 'pot_top':
-                cc_num = 0 + track_idx
-            elif control_type == 'pot_bottom':
-                cc_num = 12 + track_idx
-            else:
-                continue
+        # Diff backup against current hardware values: only restore what moved
+        changed = [
+            idx for idx, midi_value in enumerate(self._snapshot_backup)
+            if midi_value != MIDI_UNSET and midi_value != self._control_midi_values[idx]
+        ]
+        if not changed:
+            self.log_message("Snapshot restored: 0 controls (nothing changed)")
+            return
 
-            # Send MIDI to hardware
-            self._send_midi((0xB0 | self._midi_channel, cc_num, midi_value))
+        # Restore changed backup values
+        # Suspend listeners of written params only, to prevent callback flood (if enabled in config)
+        messages = []
+        with self._listeners_suspended(config.SUSPEND_LISTENERS_DURING_RESTORE, changed):
+            for idx in changed:
+                midi_value = self._snapshot_backup[idx]
+                messages.append((self._cc_status, self._cc_for_slot_ctype[idx], midi_value))
 
-            # Update parameter if mapped
-            param = self._mapped_params.get((track_idx, control_type))
-            if param:
-                # Normalize and set parameter
-                normalized = midi_value / 127.0
-                param_range = param.max - param.min
-                if param_range > 0:
-                    param.value = param.min + param_range * normalized
+                # Update parameter if mapped
+                param = self._mapped_params[idx]
+                if param:
+                    # Normalize and set parameter
+                    normalized = midi_value / 127.0
+                    param_range = self._param_range[idx]
+                    if param_range > 0:
+                        param.value = self._param_min[idx] + param_range * normalized
 
-            # Update internal tracking
-            self._control_midi_values[(track_idx, control_type)] = midi_value
-            self._control_values[(track_idx, control_type)] = midi_value / 127.0
+                # Update internal tracking
+                self._control_midi_values[idx] = midi_value
+                self._control_values[idx] = midi_value / 127.0
 
-        num_controls = len(self._snapshot_backup)
-        self.log_message("Snapshot restored: {} controls".format(num_controls))
+        # Send MIDI to hardware (outside the suspension window)
+        self._send_midi_batch(messages)
 
-        # Resume param listeners (if they were suspended)
-        if config.SUSPEND_LISTENERS_DURING_RESTORE:
-            self._resume_param_listeners()
+        self.log_message("Snapshot restored: {} controls".format(len(changed)))
 
     def _reenable_all_automations(self):
         """Re-enable automation for parameters that have automation
@@ -608,7 +702,9 @@ class FaderfoxMX12byYVMA(ControlSurface):
         "re-enable automation" arrow button in Live's interface.
         """
         count = 0
-        for (track_idx, control_type), param in self._mapped_params.items():
+        # Only params flagged by their automation_state listener (see _add_automation_listener)
+        for idx in sorted(self._automated_params):
+            param = self._mapped_params[idx]
             try:
                 # Check if parameter has automation before calling re_enable_automation()
                 if not param or not hasattr(param, 'automation_state'):
@@ -624,11 +720,11 @@ class FaderfoxMX12byYVMA(ControlSurface):
                         param.re_enable_automation()
                         count += 1
                         self.log_message("  Re-enabled automation: slot {} {} (state was {})".format(
-                            track_idx, control_type, automation_state
+                            idx // 3, CTYPE_NAMES[idx % 3], automation_state
                         ))
             except Exception as e:
                 self.log_message("  ERROR re-enabling slot {} {}: {}".format(
-                    track_idx, control_type, e
+                    idx // 3, CTYPE_NAMES[idx % 3], e
                 ))
 
         if count > 0:
@@ -648,56 +744,45 @@ class FaderfoxMX12byYVMA(ControlSurface):
         has resumed control.
         """
         # Suspend param listeners to prevent callback flood (if enabled in config)
-        if config.SUSPEND_LISTENERS_DURING_RESYNC:
-            self._suspend_param_listeners()
-
-        count = 0
-        for (track_idx, control_type), param in self._mapped_params.items():
-            try:
-                # Determine CC number based on control type
-                if control_type == 'fader':
-                    cc_num = 48 + track_idx
-                elif control_type == 'pot_top':
-                    cc_num = 0 + track_idx
-                elif control_type == 'pot_bottom':
-                    cc_num = 12 + track_idx
-                else:
+        messages = []
+        with self._listeners_suspended(config.SUSPEND_LISTENERS_DURING_RESYNC):
+            count = 0
+            for idx, param in enumerate(self._mapped_params):
+                if param is None:
                     continue
+                try:
+                    cc_num = self._cc_for_slot_ctype[idx]
 
-                # Read current parameter value from Live
-                param_range = param.max - param.min
-                if param_range > 0:
-                    normalized = (param.value - param.min) / param_range
-                else:
-                    normalized = 0.0
+                    # Read current parameter value from Live (0.0 if range is empty)
+                    # Divide, don't multiply by 1/range: keeps int() exact for 0-127 macros
+                    param_range = self._param_range[idx]
+                    normalized = (param.value - self._param_min[idx]) / param_range if param_range > 0 else 0.0
 
-                # Convert to MIDI value (0-127)
-                midi_value = int(normalized * 127)
-                midi_value = max(0, min(127, midi_value))  # Clamp
+                    # Convert to MIDI value (0-127)
+                    midi_value = self._norm_to_midi(normalized)
 
-                # Send to hardware
-                self._send_midi((0xB0 | self._midi_channel, cc_num, midi_value))
+                    # Queue for hardware (sent in one batch after the loop)
+                    messages.append((self._cc_status, cc_num, midi_value))
 
-                # Update internal trackers (critical for pickup mode)
-                self._control_midi_values[(track_idx, control_type)] = midi_value
-                self._control_values[(track_idx, control_type)] = normalized
+                    # Update internal trackers (critical for pickup mode)
+                    self._control_midi_values[idx] = midi_value
+                    self._control_values[idx] = normalized
 
-                count += 1
-                self.log_message("  Resynced slot {} {}: value={} (MIDI {})".format(
-                    track_idx, control_type, param.value, midi_value
-                ))
-            except Exception as e:
-                self.log_message("  ERROR resyncing slot {} {}: {}".format(
-                    track_idx, control_type, e
-                ))
+                    count += 1
+                    self.log_message("  Resynced slot {} {}: value={} (MIDI {})".format(
+                        idx // 3, CTYPE_NAMES[idx % 3], param.value, midi_value
+                    ))
+                except Exception as e:
+                    self.log_message("  ERROR resyncing slot {} {}: {}".format(
+                        idx // 3, CTYPE_NAMES[idx % 3], e
+                    ))
 
-        self.log_message("Hardware resync complete: {} parameters".format(count))
+        # Send MIDI to hardware (outside the suspension window)
+        self._send_midi_batch(messages)
 
-        # Resume param listeners (if they were suspended)
-        if config.SUSPEND_LISTENERS_DURING_RESYNC:
-            self._resume_param_listeners()
+        self.log_message("Hardware resync complete: {} parameters".format(count))
 
-    def _handle_encoder_scroll(self, value):
+    def _handle_encoder_scroll(self, cc_num, value):
         """Encoder scrolls through virtual track list (mode-aware)
 
         Supports ABSOLUTE encoder mode (0-127):
@@ -720,31 +805,17 @@ class FaderfoxMX12byYVMA(ControlSurface):
             self._last_encoder_value = value
             return
 
-        # Calculate difference
+        # Calculate difference, then store current value for next call
         diff = value - self._last_encoder_value
+        self._last_encoder_value = value
+
+        # Sign of the difference: +1 forward, -1 backward, 0 no change
+        scroll_direction = (diff > 0) - (diff < 0)
 
         # Detect wrap-around (127→0 or 0→127)
-        # If difference is very large, it's a wrap
+        # If difference is very large, it's a wrap - reverse the direction
         if abs(diff) > 64:
-            # Wrap detected - reverse the direction
-            if diff > 0:
-                # 0→127 is actually backward
-                scroll_direction = -1
-            else:
-                # 127→0 is actually forward
-                scroll_direction = 1
-        elif diff > 0:
-            # Normal increment - scroll forward
-            scroll_direction = 1
-        elif diff < 0:
-            # Normal decrement - scroll backward
-            scroll_direction = -1
-        else:
-            # No change
-            scroll_direction = 0
-
-        # Store current value for next call
-        self._last_encoder_value = value
+            scroll_direction = -scroll_direction
 
         # If no movement, return early
         if scroll_direction == 0:
@@ -781,11 +852,10 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
             # Get tracks in current group (until next None or end of list)
             page_start = self._scroll_offset
-            tracks_in_group = 0
-            for i in range(page_start, len(self._all_tracks_padded)):
-                if self._all_tracks_padded[i] is None:
-                    break
-                tracks_in_group += 1
+            if page_start < len(self._track_run_lengths):
+                tracks_in_group = self._track_run_lengths[page_start]
+            else:
+                tracks_in_group = 0
 
             # Calculate max local scroll
             # Can scroll if group has more tracks than NUM_TRACKS (12)
@@ -809,7 +879,7 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
         # Activate scroll position indicator for 2 seconds
         self._scroll_indicator_active = True
-        self._scroll_indicator_end_time = time.time() + 2.0
+        self._scroll_indicator_end_time = time.monotonic() + 2.0
 
         # Remap with new scroll offset
         self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
@@ -837,43 +907,42 @@ class FaderfoxMX12byYVMA(ControlSurface):
         self._scroll_offset = self._page_start_positions[page_idx]
         # Reset local scroll when changing page
         self._page_scroll_offset = 0
+        self._leds_dirty = True
 
         self.show_message("Page {}/{}".format(page_idx + 1, num_pages))
         # Update green LEDs immediately (update_display will continue updating for blinks)
         self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
         self._map_current_page()
 
-    def _handle_fader(self, track_idx, value):
-        self._handle_control(track_idx, 'fader', value)
-
-    def _handle_pot_top(self, track_idx, value):
-        self._handle_control(track_idx, 'pot_top', value)
+    def _handle_control(self, cc_num, midi_value):
+        """Handle fader/pot CC with pickup mode to prevent value jumps"""
+        key = CC_CONTROL_INDEX[cc_num]
 
-    def _handle_pot_bottom(self, track_idx, value):
-        self._handle_control(track_idx, 'pot_bottom', value)
+        # Drop repeated input: compare against the last value received on this
+        # CC, not _control_midi_values (also written by feedback/restore/resync)
+        if midi_value == self._last_in_midi_value[cc_num]:
+            return
 
-    def _handle_control(self, track_idx, control_type, midi_value):
-        """Handle control with pickup mode to prevent value jumps"""
-        param = self._mapped_params.get((track_idx, control_type))
+        param = self._mapped_params[key]
         if not param:
             return
+        self._last_in_midi_value[cc_num] = midi_value
 
         # Store MIDI value for snapshots (Phase 6)
-        key = (track_idx, control_type)
         self._control_midi_values[key] = midi_value
 
         # Normalize incoming MIDI value (0-127 → 0.0-1.0)
         incoming_normalized = midi_value / 127.0
 
-        # Get current parameter value (normalized to 0.0-1.0)
-        param_range = param.max - param.min
-        if param_range > 0:
-            param_normalized = (param.value - param.min) / param_range
-        else:
-            param_normalized = 0.0
+        param_min = self._param_min[key]
 
         # Check if we've "picked up" the parameter value yet
-        if key not in self._control_values:
+        if self._control_values[key] < 0.0:
+            # Get current parameter value (normalized to 0.0-1.0, 0.0 if range is empty)
+            # Only needed before pickup: steady-state moves skip the param.value read
+            param_range = self._param_range[key]
+            param_normalized = (param.value - param_min) / param_range if param_range > 0 else 0.0
+
             # First touch after page change - wait for pickup
             distance = abs(incoming_normalized - param_normalized)
             if distance > self.PICKUP_THRESHOLD:
@@ -888,7 +957,7 @@ class FaderfoxMX12byYVMA(ControlSurface):
         self._control_values[key] = incoming_normalized
 
         # Set parameter value
-        param.value = param.min + param_range * incoming_normalized
+        param.value = param_min + self._param_range[key] * incoming_normalized
 
     # === TRACK SCANNING & MAPPING ===
 
@@ -900,17 +969,47 @@ class FaderfoxMX12byYVMA(ControlSurface):
             0: Track with '|' (default/fill group)
             1-8: Track with '|1' to '|8'
         """
-        if track_name.endswith('|'):
+        match = GROUP_RE.search(track_name)
+        if match is None:
+            return None
+
+        digits = match.group(1)
+        if digits is None:
             return 0
 
-        match = re.search(r'\|(\d+)$', track_name)
-        if match:
-            group_num = int(match.group(1))
-            return group_num if 1 <= group_num <= 8 else None
+        group_num = int(digits)
+        return group_num if 1 <= group_num <= 8 else None
 
-        return None
+    def _parse_song_tracks(self):
+        """Walk song.tracks once and organize MX12 tracks by group
+
+        Returns:
+            (track_groups, filtered_tracks, live_track_ids, layout) where
+            layout is a tuple of (id(track), group_id) for MX12 tracks in
+            song order, used to detect changes that don't affect the pages
+        """
+        track_groups = defaultdict(list)
+        filtered_tracks = []
+        live_track_ids = set()
+        layout = []
+        self._m4l_device_cache.clear()
+        self._is_audio_cache.clear()
+        for track in self._song.tracks:
+            live_track_ids.add(id(track))
+            group_id = self._parse_track_group(track.name)
+
+            # Also check M4L device (legacy support)
+            if group_id is None and self._find_m4l_device(track) is not None:
+                group_id = 0  # Default to group 0
+
+            if group_id is not None:
+                track_groups[group_id].append(track)
+                filtered_tracks.append(track)
+                layout.append((id(track), group_id))
 
-    def _scan_tracks(self):
+        return track_groups, filtered_tracks, live_track_ids, tuple(layout)
+
+    def _scan_tracks(self, parsed=None, remap=True):
         """Scan tracks and organize into groups with smart page filling
 
         Logic:
@@ -918,26 +1017,28 @@ class FaderfoxMX12byYVMA(ControlSurface):
         2. If page has < 12 tracks, fill with | tracks (in order)
         3. If page has >= 12 tracks, no filling (scroll within page)
         4. If no |x tracks, fill pages with | tracks only
+
+        Args:
+            parsed: Result of _parse_song_tracks() if already computed
+            remap: Map the current page after the scan
         """
+        # Parse all tracks and organize by group
+        if parsed is None:
+            parsed = self._parse_song_tracks()
+        track_groups, filtered_tracks, live_track_ids, layout = parsed
+
         # Reset structures
-        self._track_groups = {}
+        self._track_groups = track_groups
         self._all_tracks_padded = []
         self._page_start_positions = []
-        self._filtered_tracks = []  # Legacy, keep for compatibility
-
-        # Parse all tracks and organize by group
-        for track in self.song().tracks:
-            group_id = self._parse_track_group(track.name)
-
-            # Also check M4L device (legacy support)
-            if group_id is None and self._find_m4l_device(track) is not None:
-                group_id = 0  # Default to group 0
+        self._filtered_tracks = filtered_tracks  # Legacy, keep for compatibility
+        self._track_layout = layout
+        self._virtual_tracks_dirty = True
+        self._page_window_key = None
+        has_numbered_groups = any(gid >= 1 for gid in track_groups)
 
-            if group_id is not None:
-                if group_id not in self._track_groups:
-                    self._track_groups[group_id] = []
-                self._track_groups[group_id].append(track)
-                self._filtered_tracks.append(track)  # Legacy
+        # Drop pins of deleted tracks (no stale references in PINS view)
+        self._prune_stale_pins(live_track_ids)
 
         # Get group 0 tracks (|) for filling
         fill_tracks = self._track_groups.get(0, [])
@@ -945,7 +1046,6 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
         # Build pages 0-7 with smart filling
         total_tracks = 0
-        has_numbered_groups = any(gid >= 1 for gid in self._track_groups.keys())
 
         if has_numbered_groups:
             # Mode 1: |1-|8 groups exist → fill each page with |x first, then | tracks
@@ -1026,6 +1126,9 @@ class FaderfoxMX12byYVMA(ControlSurface):
                 fill_index += len(page_tracks_slice)
                 page_num += 1
 
+        # Run length of tracks from each position (PAGE-mode encoder scroll range)
+        self._track_run_lengths = self._compute_track_run_lengths(self._all_tracks_padded)
+
         num_pages = len(self._page_start_positions)
         self.log_message(
             "Scan complete: {} tracks, {} groups, {} pages".format(
@@ -1033,17 +1136,57 @@ class FaderfoxMX12byYVMA(ControlSurface):
             )
         )
 
-        # Reset LEDs
-        self._led_states = [0] * self.NUM_TRACKS
+        # Map first page (resets activity LEDs via the LED cache)
+        if remap:
+            self._map_current_page()
 
-        # Map first page
-        self._map_current_page()
+    @staticmethod
+    def _compute_track_run_lengths(padded_tracks):
+        """Return, for each index, the count of tracks from there until the next None or end"""
+        run_lengths = array.array('H', [0]) * len(padded_tracks)
+        run = 0
+        for i in range(len(padded_tracks) - 1, -1, -1):
+            run = 0 if padded_tracks[i] is None else run + 1
+            run_lengths[i] = run
+        return run_lengths
+
+    def _prune_stale_pins(self, live_track_ids):
+        """Remove pinned tracks that are no longer in the song
+
+        Args:
+            live_track_ids: id() of every track in song.tracks
+        """
+        stale_ids = self._pinned_track_ids - live_track_ids
+        if not stale_ids:
+            return
+
+        self._pinned_tracks = [t for t in self._pinned_tracks if id(t) not in stale_ids]
+        self._pinned_track_ids -= stale_ids
+        self.log_message("Unpinned {} deleted track(s) (total: {})".format(
+            len(stale_ids), len(self._pinned_tracks)
+        ))
 
     def _build_virtual_track_list(self):
-        """Build virtual track list based on display mode
+        """Build virtual track list based on display mode (cached)
+
+        The list is recomputed only when the display mode or scroll offsets
+        change, or when _virtual_tracks_dirty is set (pins/track list edited).
+        Callers must not mutate the returned list.
 
         Returns:
             List of tracks to display in the 12 slots
+        """
+        key = (self._display_mode, self._scroll_offset, self._page_scroll_offset)
+        if self._virtual_tracks_dirty or key != self._virtual_tracks_key:
+            self._virtual_tracks_cache = self._compute_virtual_track_list()
+            self._virtual_tracks_key = key
+            self._virtual_tracks_dirty = False
+            # PINS mode returns _pinned_tracks itself, edited in place: force a re-slice
+            self._pins_window_source = None
+        return self._virtual_tracks_cache
+
+    def _compute_virtual_track_list(self):
+        """Compute virtual track list based on display mode
 
         Mode 'pins':
             Returns pinned tracks in order of addition (list preserves order)
@@ -1055,15 +1198,60 @@ class FaderfoxMX12byYVMA(ControlSurface):
         """
         if self._display_mode == 'pins':
             # PINS mode: return pinned tracks in order of addition
-            # _pinned_tracks is now a list, so just return a copy
-            return list(self._pinned_tracks)
+            # No copy: callers only read or slice it
+            return self._pinned_tracks
 
         else:  # 'page'
             # PAGE mode: return tracks from current page (normal behavior)
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
             # Remove None padding for virtual list
-            return [t for t in page_tracks if t is not None]
+            return [t for t in self._page_window() if t is not None]
+
+    def _page_window(self):
+        """Return the 12-slot window of _all_tracks_padded at the current scroll position (cached)
+
+        Keyed by (_scroll_offset, _page_scroll_offset); _scan_tracks invalidates it.
+        Callers must not mutate the returned list.
+        """
+        key = (self._scroll_offset, self._page_scroll_offset)
+        if key != self._page_window_key:
+            start_idx = self._scroll_offset + self._page_scroll_offset
+            self._page_window_cache = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
+            self._page_window_key = key
+        return self._page_window_cache
+
+    def _current_page_window(self):
+        """Return the tracks shown in the 12 slots for the current display mode (cached)
+
+        PAGE mode: _page_window(). PINS mode: 12-slot window of the virtual
+        list at _page_scroll_offset, re-sliced only when the virtual list is
+        rebuilt (identity alone misses in-place pin edits, see
+        _build_virtual_track_list). Callers must not mutate the returned list.
+        """
+        if self._display_mode != 'pins':
+            return self._page_window()
+
+        virtual_tracks = self._build_virtual_track_list()
+        if virtual_tracks is not self._pins_window_source:
+            start_idx = self._page_scroll_offset
+            self._pins_window_cache = virtual_tracks[start_idx:start_idx + self.NUM_TRACKS]
+            self._pins_window_source = virtual_tracks
+        return self._pins_window_cache
+
+    def _current_visible_tracks(self):
+        """Return [(slot_idx, track), ...] for the non-empty slots (cached)
+
+        Rebuilt only when _current_page_window() returns a new window (mode,
+        scroll, pins or track list changed). Callers must not mutate the list.
+        """
+        slot_tracks = self._current_page_window()
+        if slot_tracks is not self._visible_tracks_source:
+            # Windows are sliced to NUM_TRACKS already: enumerate directly, no copy
+            self._visible_tracks_cache = [
+                (slot_idx, track) for slot_idx, track in enumerate(slot_tracks)
+                if track is not None
+            ]
+            self._visible_tracks_source = slot_tracks
+        return self._visible_tracks_cache
 
     def _map_current_page(self):
         """Map tracks from current scroll position to hardware slots
@@ -1082,40 +1270,24 @@ class FaderfoxMX12byYVMA(ControlSurface):
         self._remove_param_listeners()
 
         # Clear mappings and pickup state
-        self._mapped_params.clear()
-        self._control_values.clear()  # Reset pickup mode for all controls
+        self._mapped_params[:] = [None] * NUM_CONTROLS
+        self._control_values[:] = array.array('f', [PICKUP_UNSET]) * NUM_CONTROLS  # Reset pickup mode
 
-        # Reset all activity LEDs to OFF before remapping
+        # Reset all activity LEDs to OFF before remapping (lit ones only, one batch)
+        led_states = self._led_states
+        off_msgs = self._cc_msg_table[0]
+        messages = []
         for i in range(self.NUM_TRACKS):
-            self._send_midi((0xB0 | self._midi_channel, 24 + i, 0))
-            self._led_states[i] = 0
+            if led_states[i]:
+                led_states[i] = 0
+                messages.append(off_msgs[RED_LED_CCS[i]])
+        self._send_midi_batch(messages)
 
-        if self._display_mode == 'pins':
-            # PINS MODE: Show only virtual page tracks (pinned tracks)
-            # Build virtual list (pinned tracks sorted by slot index)
-            virtual_tracks = self._build_virtual_track_list()
-
-            # Apply scroll offset for navigation if > 12 pins
-            start_idx = self._page_scroll_offset
-            visible_tracks = virtual_tracks[start_idx:start_idx + self.NUM_TRACKS]
-
-            # Map visible tracks to slots 0-N
-            for track_idx in range(min(len(visible_tracks), self.NUM_TRACKS)):
-                track = visible_tracks[track_idx]
-                if track is not None:
-                    self._map_track(track_idx, track)
-
-        else:  # 'page' mode
-            # PAGE MODE: Show ONLY page tracks (ignore pinned tracks)
-            # Get tracks for current scroll position + local scroll offset
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
-
-            # Map page tracks directly (no pin priority)
-            for track_idx in range(min(len(page_tracks), self.NUM_TRACKS)):
-                track = page_tracks[track_idx]
-                if track is not None:
-                    self._map_track(track_idx, track)
+        # PINS MODE: virtual page tracks (pinned, scrolled if > 12 pins)
+        # PAGE MODE: page tracks only at scroll + local scroll offset (no pin priority)
+        # Map visible tracks to slots 0-N
+        for track_idx, track in self._current_visible_tracks():
+            self._map_track(track_idx, track)
 
         # Update listeners for new page (will trigger LED updates)
         self._update_activity_listeners()
@@ -1128,22 +1300,27 @@ class FaderfoxMX12byYVMA(ControlSurface):
         macros = rack.parameters[1:]
 
         # Map and setup bidirectional feedback
-        controls = [
-            ('fader', 48, 0),    # Fader, CC 48+idx, macro 0
-            ('pot_top', 0, 1),   # Pot top, CC 0+idx, macro 1
-            ('pot_bottom', 12, 2) # Pot bottom, CC 12+idx, macro 2
-        ]
+        # Control type N uses macro N (fader → macro 1, pot top → 2, pot bottom → 3)
+        for ctype in CTYPES[:len(macros)]:
+            param = macros[ctype]
+            idx = track_idx * NUM_CTYPES + ctype
+            cc_num = self._cc_for_slot_ctype[idx]
+            self._mapped_params[idx] = param
+
+            # Cache the macro range (macros keep a fixed min/max)
+            pmin = param.min
+            prange = param.max - pmin
+            self._param_min[idx] = pmin
+            self._param_range[idx] = prange
 
-        for control_type, cc_base, macro_idx in controls:
-            if macro_idx < len(macros):
-                param = macros[macro_idx]
-                self._mapped_params[(track_idx, control_type)] = param
+            # Add parameter listener for bidirectional feedback
+            self._add_param_listener(idx, param)
 
-                # Add parameter listener for bidirectional feedback
-                self._add_param_listener(track_idx, control_type, param, cc_base + track_idx)
+            # Track automation state (for CC 47 re-enable)
+            self._add_automation_listener(idx, param)
 
-                # Send initial value to hardware
-                self._send_param_to_hardware(param, cc_base + track_idx)
+            # Send initial value to hardware (forced: fresh sync on every remap)
+            self._send_param_to_hardware(param, cc_num, idx, force=True)
 
     def _find_first_rack(self, track):
         """Find first rack device with macros on track
@@ -1164,57 +1341,145 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
     # === PARAMETER FEEDBACK (BIDIRECTIONAL) ===
 
-    def _add_param_listener(self, track_idx, control_type, param, cc_num):
-        """Add listener to parameter for bidirectional feedback"""
-        # Use closure to capture current values
-        def make_listener(idx, ctrl_type, prm, cc):
-            return lambda: self._on_param_value_changed(idx, ctrl_type, prm, cc)
-
-        listener = make_listener(track_idx, control_type, param, cc_num)
-        if not param.value_has_listener(listener):
+    def _add_param_listener(self, idx, param):
+        """Add listener to parameter for bidirectional feedback (idx = slot*3 + ctype)"""
+        # Live calls listeners with no arguments: bind idx, param/CC are looked up by idx
+        # _param_listeners is the source of truth (slots are cleared by
+        # _remove_param_listeners before remapping): no value_has_listener probe
+        listener = functools.partial(self._on_param_value_changed, idx)
+        try:
             param.add_value_listener(listener)
-        self._param_listeners[(track_idx, control_type)] = listener
+        except Exception as e:
+            if config.LOG_LISTENER_ADD_REMOVE:
+                self.log_message("ERROR adding listener {}: {}".format(idx, e))
+            listener = None
+        self._param_listeners[idx] = listener
 
-    def _on_param_value_changed(self, track_idx, control_type, param, cc_num):
-        """Called when a mapped parameter changes (e.g., from mouse in Ableton)"""
-        self._send_param_to_hardware(param, cc_num)
+    def _add_automation_listener(self, idx, param):
+        """Keep idx in _automated_params while the parameter has automation
 
-    def _send_param_to_hardware(self, param, cc_num):
-        """Send parameter value to hardware as MIDI CC"""
-        try:
-            # Normalize parameter value to 0-127
-            param_range = param.max - param.min
-            if param_range > 0:
-                normalized = (param.value - param.min) / param_range
-            else:
-                normalized = 0.0
+        Without the automation_state listener API, idx is always kept so
+        _reenable_all_automations still checks it.
+        """
+        if not hasattr(param, 'add_automation_state_listener'):
+            self._automated_params.add(idx)
+            return
+
+        listener = functools.partial(self._on_automation_state_changed, idx)
+        param.add_automation_state_listener(listener)
+        self._automation_listeners[idx] = listener
+        self._on_automation_state_changed(idx)
+
+    def _on_automation_state_changed(self, idx):
+        """Called when a mapped parameter gains, loses or overrides automation"""
+        if self._mapped_params[idx].automation_state != Live.DeviceParameter.AutomationState.none:
+            self._automated_params.add(idx)
+        else:
+            self._automated_params.discard(idx)
+
+    def _on_param_value_changed(self, idx):
+        """Called when a mapped parameter changes (e.g., from mouse in Ableton)
+
+        Only marks the control: automation and macro drags fire many times
+        per tick, _flush_param_feedback sends the latest value once.
+        """
+        self._feedback_dirty[idx] = 1
+        self._feedback_pending = True
+
+    def _flush_param_feedback(self):
+        """Send the current value of every control marked since the last tick"""
+        self._feedback_pending = False
+        dirty = self._feedback_dirty
+        idx = dirty.find(1)
+        while idx >= 0:
+            dirty[idx] = 0
+            param = self._mapped_params[idx]
+            if param:
+                self._send_param_to_hardware(param, self._cc_for_slot_ctype[idx], idx)
+            idx = dirty.find(1, idx + 1)
 
-            midi_value = int(normalized * 127)
-            midi_value = max(0, min(127, midi_value))  # Clamp to 0-127
+    def _send_param_to_hardware(self, param, cc_num, idx, force=False):
+        """Send parameter value to hardware as MIDI CC
 
-            self._send_midi((0xB0 | self._midi_channel, cc_num, midi_value))
+        idx (slot*3 + ctype) selects the range cached at map time, and the
+        sent value is recorded in _control_midi_values so snapshot restore
+        knows what the hardware shows. The send is skipped when the control
+        already shows that MIDI value, unless force is set.
+        """
+        try:
+            # Normalize parameter value to 0-127 (0.0 if range is empty)
+            # Divide, don't multiply by 1/range: keeps int() exact for 0-127 macros
+            param_range = self._param_range[idx]
+            normalized = (param.value - self._param_min[idx]) / param_range if param_range > 0 else 0.0
+            midi_value = self._norm_to_midi(normalized)
+
+            # Listeners fire on any float change: only 128 distinct CC values
+            if not force and self._control_midi_values[idx] == midi_value:
+                return
+            self._control_midi_values[idx] = midi_value
+            self._cc(cc_num, midi_value)
         except:
             pass
 
+    @staticmethod
+    def _norm_to_midi(normalized):
+        """Convert a normalized value (0.0-1.0) to MIDI 0-127, clamped"""
+        if normalized >= 1.0:
+            return 127
+        if normalized <= 0.0:
+            return 0
+        return int(normalized * 127)
+
     def _remove_param_listeners(self):
         """Remove all parameter listeners"""
-        for key, listener in list(self._param_listeners.items()):
-            track_idx, control_type = key
-            param = self._mapped_params.get(key)
-            if param:
+        for idx, listener in enumerate(self._param_listeners):
+            param = self._mapped_params[idx]
+            if listener and param:
                 try:
-                    if param.value_has_listener(listener):
-                        param.remove_value_listener(listener)
+                    param.remove_value_listener(listener)
                 except:
                     pass
-        self._param_listeners.clear()
+        self._param_listeners[:] = [None] * NUM_CONTROLS
 
-    def _suspend_param_listeners(self):
+        for idx, listener in enumerate(self._automation_listeners):
+            param = self._mapped_params[idx]
+            if listener and param:
+                try:
+                    param.remove_automation_state_listener(listener)
+                except:
+                    pass
+        self._automation_listeners[:] = [None] * NUM_CONTROLS
+        self._automated_params.clear()
+
+    @contextlib.contextmanager
+    def _listeners_suspended(self, enabled=True, indices=None):
+        """Context manager: suspend param listeners during a bulk update
+
+        Listeners are resumed on exit, even if the bulk update raises.
+
+        Args:
+            enabled: Config switch (e.g. config.SUSPEND_LISTENERS_DURING_RESTORE)
+            indices: Flat control indices being written (None = all)
+        """
+        if not enabled:
+            yield
+            return
+
+        self._suspend_param_listeners(indices)
+        try:
+            yield
+        finally:
+            self._resume_param_listeners()
+
+    def _suspend_param_listeners(self, indices=None):
         """Temporarily suspend param listeners to prevent callback flood during bulk operations
 
         Moves listeners from _param_listeners to _suspended_listeners and removes them
         from their parameters. This prevents the flood of callbacks when updating many
         parameters at once (e.g., restore 36 values), which can cause Live to "lose" listeners.
+
+        Args:
+            indices: Flat control indices to suspend (None = all mapped controls)
         """
         if not config.ENABLE_PARAM_LISTENERS:
             return  # Listeners disabled, nothing to suspend
@@ -1226,15 +1491,15 @@ class FaderfoxMX12byYVMA(ControlSurface):
             return
 
         count = 0
-        for key, listener in list(self._param_listeners.items()):
-            param = self._mapped_params.get(key)
-            if param:
+        for key in (range(NUM_CONTROLS) if indices is None else indices):
+            listener = self._param_listeners[key]
+            param = self._mapped_params[key]
+            if listener and param:
                 try:
-                    if param.value_has_listener(listener):
-                        param.remove_value_listener(listener)
-                        # Store for resume: (key, listener, param)
-                        self._suspended_listeners[key] = (listener, param)
-                        count += 1
+                    param.remove_value_listener(listener)
+                    # Store for resume: (key, listener, param)
+                    self._suspended_listeners[key] = (listener, param)
+                    count += 1
                 except Exception as e:
                     if config.LOG_LISTENER_ADD_REMOVE:
                         self.log_message("ERROR suspending listener {}: {}".format(key, e))
@@ -1260,9 +1525,8 @@ class FaderfoxMX12byYVMA(ControlSurface):
         count = 0
         for key, (listener, param) in list(self._suspended_listeners.items()):
             try:
-                if not param.value_has_listener(listener):
-                    param.add_value_listener(listener)
-                    count += 1
+                param.add_value_listener(listener)
+                count += 1
             except Exception as e:
                 if config.LOG_LISTENER_ADD_REMOVE:
                     self.log_message("ERROR resuming listener {}: {}".format(key, e))
@@ -1277,32 +1541,13 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
     def _update_activity_listeners(self):
         """Setup listeners for currently mapped tracks (mode-aware)"""
-        # Remove all existing listeners
+        # Remove all existing listeners, then look M4L devices up afresh
         self._remove_all_activity_listeners()
+        self._m4l_device_cache.clear()
+        self._is_audio_cache.clear()
 
         # Get currently mapped tracks based on display mode
-        mapped_tracks = []
-
-        if self._display_mode == 'pins':
-            # PINS MODE: Get tracks from virtual page
-            virtual_tracks = self._build_virtual_track_list()
-            start_idx = self._page_scroll_offset
-            visible_tracks = virtual_tracks[start_idx:start_idx + self.NUM_TRACKS]
-
-            for track_idx in range(min(len(visible_tracks), self.NUM_TRACKS)):
-                track = visible_tracks[track_idx]
-                if track is not None:
-                    mapped_tracks.append((track_idx, track))
-
-        else:  # 'page' mode
-            # PAGE MODE: Get tracks from current page only
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
-
-            for track_idx in range(min(len(page_tracks), self.NUM_TRACKS)):
-                track = page_tracks[track_idx]
-                if track is not None:
-                    mapped_tracks.append((track_idx, track))
+        mapped_tracks = self._current_visible_tracks()
 
         # Add listeners for each mapped track
         for track_idx, track in mapped_tracks:
@@ -1315,37 +1560,24 @@ class FaderfoxMX12byYVMA(ControlSurface):
 
     def _force_activity_led_update(self):
         """Force immediate LED update by reading current activity state (mode-aware)"""
-        self.log_message("_force_activity_led_update: mode={}, scroll_offset={}, page_scroll_offset={}".format(
-            self._display_mode, self._scroll_offset, self._page_scroll_offset
-        ))
+        # Detail logs are gated on DEBUG_VU: no formatting or track.name reads when off
+        if DEBUG_VU:
+            self.log_message("_force_activity_led_update: mode={}, scroll_offset={}, page_scroll_offset={}".format(
+                self._display_mode, self._scroll_offset, self._page_scroll_offset
+            ))
 
         # Get currently mapped tracks based on display mode
-        tracks_to_update = []
-
-        if self._display_mode == 'pins':
-            # PINS MODE: Get tracks from virtual page
-            virtual_tracks = self._build_virtual_track_list()
-            start_idx = self._page_scroll_offset
-            visible_tracks = virtual_tracks[start_idx:start_idx + self.NUM_TRACKS]
-
-            for track_idx in range(min(len(visible_tracks), self.NUM_TRACKS)):
-                track = visible_tracks[track_idx]
-                if track is not None:
-                    tracks_to_update.append((track_idx, track))
-
-        else:  # 'page' mode
-            # PAGE MODE: Get tracks from current page only
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
-
-            for track_idx in range(min(len(page_tracks), self.NUM_TRACKS)):
-                track = page_tracks[track_idx]
-                if track is not None:
-                    tracks_to_update.append((track_idx, track))
+        tracks_to_update = self._current_visible_tracks()
 
         # Update LEDs for each mapped track
         for track_idx, track in tracks_to_update:
 
+            # VU-listened slots are read by the next update_display tick
+            if (track_idx, 'vu') in self._active_listeners:
+                self._vu_dirty[track_idx] = 1
+                self._vu_pending = True
+                continue
+
             # Check activity based on track type
             is_audio = self._is_audio_track(track)
 
@@ -1354,10 +1586,9 @@ class FaderfoxMX12byYVMA(ControlSurface):
                 try:
                     level = max(track.output_meter_left, track.output_meter_right)
                     new_value = 127 if level > 0.001 else 0
-                    cc_num = 24 + track_idx
-                    self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                    self._led_states[track_idx] = new_value
-                    self.log_message(f"  Slot {track_idx} ({track.name}): VU={level:.3f} -> LED={new_value}")
+                    self._send_cc_if_changed(self._led_states, track_idx, RED_LED_CCS[track_idx], new_value, force=True)
+                    if DEBUG_VU:
+                        self.log_message("  Slot {} ({}): VU={:.3f} -> LED={}".format(track_idx, track.name, level, new_value))
                 except Exception as e:
                     self.log_message(f"  Slot {track_idx} VU error: {e}")
             else:
@@ -1370,10 +1601,10 @@ class FaderfoxMX12byYVMA(ControlSurface):
                             try:
                                 param_value = param.value
                                 new_value = 127 if param_value > 0 else 0
-                                cc_num = 24 + track_idx
-                                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                                self._led_states[track_idx] = new_value
-                                self.log_message(f"  Slot {track_idx} ({track.name}): M4L param={param_value} -> LED={new_value}")
+                                self._send_cc_if_changed(self._led_states, track_idx, RED_LED_CCS[track_idx], new_value, force=True)
+                                if DEBUG_VU:
+                                    self.log_message("  Slot {} ({}): M4L param={} -> LED={}".format(
+                                        track_idx, track.name, param_value, new_value))
                             except Exception as e:
                                 self.log_message(f"  Slot {track_idx} M4L error: {e}")
                             break
@@ -1382,10 +1613,10 @@ class FaderfoxMX12byYVMA(ControlSurface):
                     try:
                         level = max(track.output_meter_left, track.output_meter_right)
                         new_value = 127 if level > 0.001 else 0
-                        cc_num = 24 + track_idx
-                        self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                        self._led_states[track_idx] = new_value
-                        self.log_message(f"  Slot {track_idx} ({track.name}): VU fallback={level:.3f} -> LED={new_value}")
+                        self._send_cc_if_changed(self._led_states, track_idx, RED_LED_CCS[track_idx], new_value, force=True)
+                        if DEBUG_VU:
+                            self.log_message("  Slot {} ({}): VU fallback={:.3f} -> LED={}".format(
+                                track_idx, track.name, level, new_value))
                     except Exception as e:
                         self.log_message(f"  Slot {track_idx} VU fallback error: {e}")
 
@@ -1404,16 +1635,9 @@ class FaderfoxMX12byYVMA(ControlSurface):
         if is_audio and track.name.endswith('|'):
             try:
                 # Audio track - listen to output_meter_level
-                # Use closure to capture current values (not references)
-                def make_vu_listener(idx, trk):
-                    return lambda: self._on_vu_meter_change(idx, trk)
-
-                listener = make_vu_listener(track_idx, track)
-                if not track.output_meter_level_has_listener(listener):
-                    track.add_output_meter_level_listener(listener)
-                # Store listener AND track for proper cleanup
-                self._active_listeners[(track_idx, 'vu')] = (listener, track)
-                self.log_message("Added VU listener for slot {}: {} (Audio)".format(track_idx, track.name))
+                self._add_vu_listener(track_idx, track)
+                if config.LOG_LISTENER_ADD_REMOVE:
+                    self.log_message("Added VU listener for slot {}: {} (Audio)".format(track_idx, track.name))
             except:
                 pass
         else:
@@ -1423,114 +1647,196 @@ class FaderfoxMX12byYVMA(ControlSurface):
                 # M4L device found → Use parameter listener
                 for param in device.parameters:
                     if param.name == "midi_active":
-                        # Use closure to capture current values (not references)
-                        def make_m4l_listener(idx, prm):
-                            return lambda: self._on_m4l_param_change(idx, prm)
-
-                        listener = make_m4l_listener(track_idx, param)
+                        listener = self._m4l_callbacks[track_idx]
+                        self._m4l_params[track_idx] = param
                         if not param.value_has_listener(listener):
                             param.add_value_listener(listener)
-                        # Store listener AND track for proper cleanup
-                        self._active_listeners[(track_idx, 'm4l')] = (listener, track)
-                        self.log_message("Added M4L listener for slot {}: {} (M4L)".format(track_idx, track.name))
+                        # Store listener, track AND param: removal needs no device lookup
+                        self._active_listeners[(track_idx, 'm4l')] = (listener, track, param)
+                        if config.LOG_LISTENER_ADD_REMOVE:
+                            self.log_message("Added M4L listener for slot {}: {} (M4L)".format(track_idx, track.name))
                         break
             else:
                 # No M4L device → Fallback to VU meter
                 # (MIDI tracks with instruments generate audio output)
                 try:
-                    def make_vu_listener(idx, trk):
-                        return lambda: self._on_vu_meter_change(idx, trk)
-
-                    listener = make_vu_listener(track_idx, track)
-                    if not track.output_meter_level_has_listener(listener):
-                        track.add_output_meter_level_listener(listener)
-                    self._active_listeners[(track_idx, 'vu')] = (listener, track)
-                    self.log_message("Added VU listener (fallback) for slot {}: {} (MIDI with audio output)".format(track_idx, track.name))
-                except Exception as e:
+                    self._add_vu_listener(track_idx, track)
+                    if config.LOG_LISTENER_ADD_REMOVE:
+                        self.log_message("Added VU listener (fallback) for slot {}: {} (MIDI with audio output)".format(track_idx, track.name))
+                except:
                     # VU meter not available (pure MIDI track with no audio)
                     self.log_message("WARNING: No listener for slot {}: {} (no M4L device, no audio output)".format(track_idx, track.name))
 
+    def _add_vu_listener(self, track_idx, track):
+        """Listen to track.output_meter_level with the slot's VU callback (raises if no meters)"""
+        listener = self._vu_callbacks[track_idx]
+        if not track.output_meter_level_has_listener(listener):
+            track.add_output_meter_level_listener(listener)
+        # Store listener AND track for proper cleanup
+        self._active_listeners[(track_idx, 'vu')] = (listener, track, None)
+
     def _is_audio_track(self, track):
-        """Check if track is audio (has VU meters) - safe wrapper"""
-        try:
-            # Try to access output_meter_left - if it works, it's an audio track
-            _ = track.output_meter_left
-            return True
-        except:
-            # MIDI tracks throw exception when accessing output_meter_left
-            return False
+        """Check if track is audio (has VU meters) - safe wrapper, memoized by id(track)"""
+        key = id(track)
+        is_audio = self._is_audio_cache.get(key)
+        if is_audio is None:
+            try:
+                # Try to access output_meter_left - if it works, it's an audio track
+                _ = track.output_meter_left
+                is_audio = True
+            except:
+                # MIDI tracks throw exception when accessing output_meter_left
+                is_audio = False
+            self._is_audio_cache[key] = is_audio
+        return is_audio
 
-    def _on_vu_meter_change(self, track_idx, track):
-        """VU meter listener callback"""
-        try:
-            level = max(track.output_meter_left, track.output_meter_right)
-            new_value = 127 if level > 0.001 else 0
+    def _on_vu_meter_change(self, track_idx):
+        """VU meter listener callback
 
-            if self._led_states[track_idx] != new_value:
-                cc_num = 24 + track_idx
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._led_states[track_idx] = new_value
-        except:
-            pass
+        Fires at meter rate: only marks the slot, _poll_vu_meters reads the
+        level once per update_display tick.
+        """
+        self._vu_dirty[track_idx] = 1
+        self._vu_pending = True
+
+    def _poll_vu_meters(self):
+        """Update the activity LED of every slot whose VU meter changed since the last tick"""
+        self._vu_pending = False
+        dirty = self._vu_dirty
+        track_idx = dirty.find(1)
+        while track_idx >= 0:
+            dirty[track_idx] = 0
+            entry = self._active_listeners.get((track_idx, 'vu'))
+            if entry:
+                track = entry[1]
+                # Only the Live getters can raise (track deleted / no meters)
+                try:
+                    level = max(track.output_meter_left, track.output_meter_right)
+                except:
+                    pass
+                else:
+                    new_value = 127 if level > 0.001 else 0
+                    self._send_cc_if_changed(self._led_states, track_idx, RED_LED_CCS[track_idx], new_value)
+            track_idx = dirty.find(1, track_idx + 1)
 
-    def _on_m4l_param_change(self, track_idx, param):
+    def _on_m4l_param_change(self, track_idx):
         """M4L parameter listener callback"""
-        try:
-            new_value = 127 if param.value > 0 else 0
-
-            # Debug logging for slots 8-11
-            if track_idx >= 8:
-                self.log_message(f"M4L callback slot {track_idx}: param={param.value}, new_value={new_value}")
-
-            if self._led_states[track_idx] != new_value:
-                cc_num = 24 + track_idx
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._led_states[track_idx] = new_value
+        param = self._m4l_params[track_idx]
+        if param is None:
+            return
 
-                # Debug logging for MIDI send
-                if track_idx >= 8:
-                    self.log_message(f"Sent MIDI: CC {cc_num} = {new_value}")
+        # Only the Live getter can raise (device removed)
+        try:
+            param_value = param.value
         except Exception as e:
             if track_idx >= 8:
                 self.log_message(f"ERROR in M4L callback slot {track_idx}: {e}")
+            return
+
+        new_value = 127 if param_value > 0 else 0
+
+        # Debug logging for slots 8-11 (formatted only when enabled)
+        if DEBUG_M4L and track_idx >= 8:
+            self.log_message(f"M4L callback slot {track_idx}: param={param_value}, new_value={new_value}")
+
+        cc_num = RED_LED_CCS[track_idx]
+        if self._send_cc_if_changed(self._led_states, track_idx, cc_num, new_value):
+            # Debug logging for MIDI send
+            if DEBUG_M4L and track_idx >= 8:
+                self.log_message(f"Sent MIDI: CC {cc_num} = {new_value}")
 
     def _remove_all_activity_listeners(self):
-        """Remove all activity listeners (using stored track references)"""
-        for key, (listener, track) in list(self._active_listeners.items()):
+        """Remove all activity listeners (using stored track/param references)"""
+        # Swap in a fresh dict: the old one is walked once, no copy and no clear()
+        old_listeners = self._active_listeners
+        self._active_listeners = {}
+        for key, (listener, track, param) in old_listeners.items():
             track_idx, listener_type = key
 
             try:
                 if listener_type == 'vu':
                     if track.output_meter_level_has_listener(listener):
                         track.remove_output_meter_level_listener(listener)
-                        self.log_message("Removed VU listener from slot {}".format(track_idx))
+                        if config.LOG_LISTENER_ADD_REMOVE:
+                            self.log_message("Removed VU listener from slot {}".format(track_idx))
                 elif listener_type == 'm4l':
-                    device = self._find_m4l_device(track)
-                    if device:
-                        for param in device.parameters:
-                            if param.name == "midi_active":
-                                if param.value_has_listener(listener):
-                                    param.remove_value_listener(listener)
-                                    self.log_message("Removed M4L listener from slot {}".format(track_idx))
-                                break
+                    if param.value_has_listener(listener):
+                        param.remove_value_listener(listener)
+                        if config.LOG_LISTENER_ADD_REMOVE:
+                            self.log_message("Removed M4L listener from slot {}".format(track_idx))
             except Exception as e:
                 self.log_message("Error removing listener slot {}: {}".format(track_idx, e))
 
-        self._active_listeners.clear()
+        self._m4l_params[:] = [None] * 12
         self.log_message("All activity listeners cleared")
 
     def _find_m4l_device(self, track):
-        """Find M4L device on track"""
+        """Find M4L device on track (memoized by id(track))
+
+        The cache is cleared before each track list walk and each activity
+        listener refresh, so devices added or removed since are picked up there.
+        """
+        key = id(track)
+        cache = self._m4l_device_cache
+        if key in cache:
+            return cache[key]
+
+        result = None
+        device_name = self.DEVICE_NAME
         try:
             for device in track.devices:
-                if device.name == self.DEVICE_NAME or self.DEVICE_NAME in device.name:
-                    return device
+                if device_name in device.name:  # Also covers an exact match
+                    result = device
+                    break
         except:
-            pass
-        return None
+            pass  # Track deleted while walking its devices
+        cache[key] = result
+        return result
 
     # === LED UPDATES ===
 
+    def _cc(self, cc_num, value):
+        """Send a Control Change on the surface MIDI channel"""
+        msgs = self._cc_msg_table[value]
+        self._send_midi(msgs[cc_num] if msgs else (self._cc_status, cc_num, value))
+
+    def _cc_message(self, cc_num, value):
+        """Return the (status, cc, value) tuple of a Control Change, for batched sends"""
+        msgs = self._cc_msg_table[value]
+        return msgs[cc_num] if msgs else (self._cc_status, cc_num, value)
+
+    def _send_midi_batch(self, messages):
+        """Send a list of MIDI messages (status, data1, data2) in one tight loop"""
+        send_midi = self._send_midi
+        for message in messages:
+            send_midi(message)
+
+    def _send_cc_if_changed(self, cache, idx, cc_num, value, force=False):
+        """Send CC to hardware only if value differs from cached state
+
+        Args:
+            cache: State cache indexed by idx (e.g. _led_states, _page_led_states)
+            idx: Index into cache
+            cc_num: CC number to send
+            value: CC value (0-127)
+            force: Bypass the cache and always send (initial sync / hardware resync)
+
+        Returns:
+            True if MIDI was sent, False if skipped (value unchanged)
+        """
+        if not force and cache[idx] == value:
+            return False
+        cache[idx] = value
+        msgs = self._cc_msg_table[value]
+        self._send_midi(msgs[cc_num] if msgs else (self._cc_status, cc_num, value))
+        return True
+
+    def _queue_cc_if_changed(self, messages, cache, idx, cc_num, value):
+        """Like _send_cc_if_changed, but append the CC to messages for a later batched send"""
+        if cache[idx] != value:
+            cache[idx] = value
+            messages.append(self._cc_message(cc_num, value))
+
     def _update_page_leds(self):
         """Update green LEDs (CC 36-47): 8 page buttons + 4 function buttons
 
@@ -1540,92 +1846,73 @@ class FaderfoxMX12byYVMA(ControlSurface):
         """
         updated = []
 
-        # Page buttons (CC 36-43)
-        for i in range(8):
-            cc_num = 36 + i
-            # Normal polarity: 127=ON, 0=OFF
-            new_value = 127 if i == self._current_page else 0
-            if self._page_led_states[i] != new_value:
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._page_led_states[i] = new_value
-                updated.append("CC{}={}".format(cc_num, new_value))
-
-        # Function buttons (CC 44-47) - OFF for now (Phase 5 will add alternance)
-        for i in range(8, 12):
-            cc_num = 36 + i  # 44-47
-            new_value = 0  # OFF
-            if self._page_led_states[i] != new_value:
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._page_led_states[i] = new_value
+        # Page buttons (CC 36-43): current page ON (normal polarity: 127=ON, 0=OFF)
+        # Function buttons (CC 44-47): OFF for now (Phase 5 will add alternance)
+        current_page = self._current_page if self._current_page < 8 else None
+        for i in range(12):
+            cc_num = GREEN_LED_CCS[i]
+            new_value = 127 if i == current_page else 0
+            if self._send_cc_if_changed(self._page_led_states, i, cc_num, new_value):
                 updated.append("CC{}={}".format(cc_num, new_value))
 
         if updated:
             self.log_message("Page LEDs updated: {}".format(', '.join(updated)))
 
-    def _get_track_origin_page(self, track):
-        """Find which page a track originally belongs to (without locks)"""
-        for idx, t in enumerate(self._all_tracks_padded):
-            if t is not None and id(t) == id(track):
-                # Find which page this index belongs to using _page_start_positions
-                for page_idx in range(len(self._page_start_positions)):
-                    page_start = self._page_start_positions[page_idx]
-                    # Last page check
-                    if page_idx == len(self._page_start_positions) - 1:
-                        if idx >= page_start:
-                            return page_idx
-                    else:
-                        page_end = self._page_start_positions[page_idx + 1]
-                        if page_start <= idx < page_end:
-                            return page_idx
-        return None
-
     def _force_resync_green_leds(self):
         """Force complete resync of green LEDs (after hardware button press/release)"""
-        # Reset state to force resend of all LEDs
-        self._page_led_states = [0] * 12  # All OFF
-        # Update with current blink states
-        self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
+        # Update with current blink states, bypassing the LED cache
+        self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state, force=True)
 
-    def _force_resync_all_leds(self):
+    def _force_resync_all_leds(self, force=False, pressed_cc=None):
         """Force complete resync of ALL LEDs (red activity + green page/pins)
 
-        Called on every button press/release to prevent hardware local toggle
-        from "breaking" the display.
+        Prevents hardware local toggle from "breaking" the display. Called on:
+        - Every button press (red, page, function)
+        - Page and function button releases (red releases never change LEDs)
+        - Deferred flushes from update_display (throttled resyncs)
+        - Display mode switches (forced, bypasses the throttle)
 
         CPU Optimizations:
         - Throttle: 50ms cooldown to prevent spam on rapid button presses
+          (skipped resyncs are coalesced and flushed by update_display)
         - Cache-based: Use cached LED states instead of re-reading VU/M4L
+
+        Args:
+            force: Bypass the throttle (e.g. display mode switch)
+            pressed_cc: CC of the button that triggered the resync. Only that
+                button toggles its LED locally, so OFF activity LEDs other
+                than its own are not resent. None resends all activity LEDs
+                (deferred resyncs, which may cover several presses).
         """
-        # OPTIMIZATION 1: Throttle - Skip if called too recently
-        now = time.time()
-        if now - self._last_resync_time < self._resync_cooldown:
-            return  # Skip this resync, too soon
+        # OPTIMIZATION 1: Throttle - Defer if called too recently
+        # time.monotonic() is immune to wall-clock jumps
+        now = time.monotonic()
+        if not force and now - self._last_resync_time < self._resync_cooldown:
+            self._pending_resync = True  # Coalesce, flushed on next update_display
+            return
         self._last_resync_time = now
+        self._pending_resync = False
+        self._leds_dirty = False
 
         # OPTIMIZATION 2: Cache-based resync
         # Instead of re-reading VU meters and M4L params, use cached LED states
-        # that are already kept up-to-date by listeners
-
-        # Store current states before reset
-        cached_activity_states = list(self._led_states)  # Copy current activity LED states
-        cached_page_states = list(self._page_led_states)  # Copy current page LED states
-
-        # Reset states to force resend (hardware might have toggled locally)
-        self._led_states = [127] * 12  # Invalidate cache (activity LEDs)
-        self._page_led_states = [0] * 12  # Invalidate cache (page LEDs)
-
-        # Resync activity LEDs (red, CC 24-35) - use CACHED values
-        for track_idx in range(self.NUM_TRACKS):
-            # Use cached state updated by listeners (no VU/M4L read!)
-            cached_value = cached_activity_states[track_idx]
-            cc_num = 24 + track_idx
-            self._send_midi((0xB0 | self._midi_channel, cc_num, cached_value))
-            self._led_states[track_idx] = cached_value
+        # that are already kept up-to-date by listeners.
+        # force=True resends them anyway (hardware might have toggled locally)
+
+        # Resync activity LEDs (red, CC 24-35) - use CACHED values, one batch
+        # (cached state is updated by listeners: no VU/M4L read!)
+        # Lit LEDs + the pressed one: OFF LEDs nobody pressed are still OFF
+        led_states = self._led_states
+        self._send_midi_batch([
+            self._cc_message(cc_num, led_states[track_idx])
+            for track_idx, cc_num in enumerate(RED_LED_CCS)
+            if pressed_cc is None or led_states[track_idx] or cc_num == pressed_cc
+        ])
 
         # Resync page/pin LEDs (green, CC 36-47)
-        self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
+        self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state, force=True)
 
-    def _update_scroll_position_indicator(self):
+    def _update_scroll_position_indicator(self, force=False):
         """Show scroll position indicator on green LEDs for 2 seconds after scrolling
 
         Depth indicator visualization: Shows how deep you scrolled from start
@@ -1639,46 +1926,23 @@ class FaderfoxMX12byYVMA(ControlSurface):
         - Scroll offset 3 (viewing 4-15): LEDs 9,10,11 ON (3 tracks deep)
         - Scroll offset 12 (viewing 13-24): All 12 LEDs ON (12 tracks deep)
 
-        IMPORTANT: Forces ALL LEDs to update (ignores cache) to ensure clean display
+        Args:
+            force: Resend ALL LEDs (ignore cache), used by forced resyncs
         """
-        # Get scroll offset (how deep we are from start)
-        if self._display_mode == 'locks':
-            offset = self._page_scroll_offset
-        else:
-            offset = self._page_scroll_offset
-
-        # If at start position, turn all OFF
-        if offset == 0:
-            for i in range(12):
-                cc_num = 36 + i
-                self._send_midi((0xB0 | self._midi_channel, cc_num, 0))
-                self._page_led_states[i] = 0
-            return
-
-        # Calculate how many LEDs to light (max 12)
-        num_leds = min(offset, 12)
-
-        # FORCE UPDATE: Set all LEDs
-        # Fill from RIGHT to LEFT (LED 11, 10, 9... down to 0)
-        for i in range(12):
-            cc_num = 36 + i
-            new_value = 0  # Default: OFF
-
-            # Light LEDs from right (11) to left (0)
-            # Example: offset=3 → LEDs 11, 10, 9 ON
-            if i >= (12 - num_leds):
-                new_value = 127  # ON
+        # Light min(offset, 12) LEDs from the right (offset 0: all OFF)
+        # Example: offset=3 → LEDs 9, 10, 11 ON
+        num_leds = min(self._page_scroll_offset, 12)
+        desired = bytearray(12 - num_leds) + bytearray([127]) * num_leds
 
-            # FORCE UPDATE: Always send MIDI (ignore cache)
-            self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-            self._page_led_states[i] = new_value
+        self._send_green_leds(desired, force)
 
-    def _update_green_leds_with_pins(self, fast_blink, slow_blink):
+    def _update_green_leds_with_pins(self, fast_blink, slow_blink, force=False):
         """Update all 12 green LEDs with display mode awareness
 
         Args:
             fast_blink: 2.5Hz blink for virtual page tracks (not on current page)
             slow_blink: 1Hz blink for double function (virtual page + current page)
+            force: Resend all LEDs even if cached state matches (hardware resync)
 
         SCROLL INDICATOR MODE (temporary, 2 seconds after scroll):
         - Shows scroll position visualization
@@ -1695,174 +1959,221 @@ class FaderfoxMX12byYVMA(ControlSurface):
         - Track in virtual page (not page button): FAST BLINK 2.5Hz (⚡ attention)
         - Current page button (no virtual track): FIXED ON (💡 page indicator)
         - This provides clear visual differentiation for all states
+
+        The 12 target values are built first, then diffed against the LED
+        cache and sent as one batch (see _send_green_leds).
         """
         # Priority 1: Scroll position indicator (overrides everything for 2 seconds)
         if self._scroll_indicator_active:
-            self._update_scroll_position_indicator()
+            self._update_scroll_position_indicator(force)
             return
 
-        if self._display_mode == 'pins':
-            # PINS MODE: All page buttons OFF, CC 45 ON
-            # FORCE UPDATE: Always send MIDI (ignore cache) to ensure clean display
-            for i in range(12):
-                cc_num = 36 + i
-                new_value = 0  # Default: OFF
-
-                # CC 45 (slot 9): FIXED ON to indicate PINS mode
-                if i == 9:  # Slot 9 = CC 45
-                    new_value = 127
-
-                # CC 46-47 (slots 10-11): Snapshot/Recording handled elsewhere
-                # Don't override if snapshot or recording is active
-                if i == self._recording_led_slot:
-                    # Skip - handled by update_display() for snapshot LED
-                    continue
+        desired = bytearray(12)  # Default: all OFF (127=ON, 0=OFF)
 
-                # FORCE UPDATE: Always send MIDI (ignore cache)
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._page_led_states[i] = new_value
+        if self._display_mode == 'pins':
+            # PINS MODE: All page buttons OFF, CC 45 (slot 9) FIXED ON
+            desired[9] = 127
 
         else:  # 'page' mode
             # PAGE MODE: Page indicator + virtual page membership visualization
-            # Get current page tracks to check if they're in virtual page
-            start_idx = self._scroll_offset + self._page_scroll_offset
-            page_tracks = self._all_tracks_padded[start_idx:start_idx + self.NUM_TRACKS]
-
-            for i in range(12):
-                cc_num = 36 + i
-                new_value = 0  # Default: OFF (127=ON, 0=OFF)
-
-                # Check if track in this slot is in virtual page
-                track_in_virtual_page = False
-                if i < len(page_tracks) and page_tracks[i] is not None:
-                    track_in_virtual_page = page_tracks[i] in self._pinned_tracks
-
-                # Determine LED pattern based on context
-                if track_in_virtual_page:
-                    # Track is in virtual page
-                    # Check if this is ALSO a page button for current page (double function)
-                    if i < 8 and i == self._current_page:
-                        # DOUBLE FUNCTION: Track in virtual page + current page button
-                        # → SLOW BLINK (1Hz) - subtle, both functions visible
-                        new_value = 127 if slow_blink else 0
-                    else:
-                        # Track in virtual page ONLY (not current page button)
-                        # → FAST BLINK (2.5Hz) - attracts attention
-                        new_value = 127 if fast_blink else 0
-
-                # Page button - show current page if not in virtual page
-                elif i < 8 and i == self._current_page:
-                    # Current page, no track in virtual page → FIXED ON
-                    new_value = 127
-
-                # CC 46-47 (slots 10-11): Snapshot/Recording handled elsewhere
-                # Don't override if snapshot or recording is active
-                if i == self._recording_led_slot:
-                    # Skip - handled by update_display() for snapshot LED
-                    continue
+            current_page = self._current_page
+
+            # Current page button, no track in virtual page → FIXED ON
+            if current_page < 8:
+                desired[current_page] = 127
+
+            # Tracks of the current page that are in virtual page (pinned):
+            # only their set bits are visited
+            pinned_mask = self._pinned_slot_mask()
+            if pinned_mask:
+                fast_value = 127 if fast_blink else 0
+                slow_value = 127 if slow_blink else 0
+                while pinned_mask:
+                    low_bit = pinned_mask & -pinned_mask
+                    i = low_bit.bit_length() - 1
+                    # Also the current page button (double function) → SLOW BLINK (1Hz)
+                    # Virtual page only → FAST BLINK (2.5Hz) - attracts attention
+                    desired[i] = slow_value if i == current_page else fast_value
+                    pinned_mask ^= low_bit
+
+        # CC 47 (slot 11): Snapshot/Recording LED handled by update_display()
+        self._send_green_leds(desired, force, skip_slot=self._recording_led_slot)
+
+    def _pinned_slot_mask(self):
+        """Return the 12-bit mask of page window slots holding a pinned track (cached)
+
+        Rebuilt when _page_window() returns a new window (scroll, page or
+        track list changed) or after a pin toggle, not on every blink.
+        """
+        page_tracks = self._page_window()
+        if page_tracks is not self._pinned_mask_source:
+            pinned_ids = self._pinned_track_ids
+            mask = 0
+            if pinned_ids:
+                for i, track in enumerate(page_tracks):
+                    if track is not None and id(track) in pinned_ids:
+                        mask |= 1 << i
+            self._pinned_mask_cache = mask
+            self._pinned_mask_source = page_tracks
+        return self._pinned_mask_cache
+
+    def _send_green_leds(self, desired, force=False, skip_slot=None):
+        """Send the green LEDs (CC 36-47) whose cached state differs from desired
 
-                # Update LED
-                if self._page_led_states[i] != new_value:
-                    self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                    self._page_led_states[i] = new_value
+        Args:
+            desired: 12 target values (0/127), indexed by slot
+            force: Resend all LEDs even if cached state matches (hardware resync)
+            skip_slot: Slot left untouched (driven elsewhere)
+        """
+        led_states = self._page_led_states
+        messages = []
+        for i in range(12):
+            value = desired[i]
+            if i == skip_slot or (not force and led_states[i] == value):
+                continue
+            led_states[i] = value
+            messages.append(self._cc_message(GREEN_LED_CCS[i], value))
+        self._send_midi_batch(messages)
 
     # === LISTENERS & DISPLAY ===
 
     def _setup_listeners(self):
-        self.song().add_tracks_listener(self._on_tracks_changed)
+        self._song.add_tracks_listener(self._on_tracks_changed)
 
     def _on_tracks_changed(self):
+        parsed = self._parse_song_tracks()
+        live_track_ids = parsed[2]
+
+        # Non-MX12 track added/removed/moved: pages and pins are unaffected
+        if parsed[3] == self._track_layout and not (self._pinned_track_ids - live_track_ids):
+            self.log_message("Tracks changed - MX12 layout unchanged, skipping rescan")
+            return
+
         self.log_message("Tracks changed - rescanning")
-        self._scan_tracks()
+        old_window = self._current_page_window()
+        self._scan_tracks(parsed, remap=False)
+        self._leds_dirty = True  # Page layout / pins may have changed
+
+        # Remap only if the tracks shown in the 12 slots changed
+        new_window = self._current_page_window()
+        if len(new_window) == len(old_window) and all(a is b for a, b in zip(new_window, old_window)):
+            self.log_message("Current page unchanged, keeping mapping")
+        else:
+            self._map_current_page()
 
     def update_display(self):
         """Called ~10Hz by Ableton for display updates and blinking
 
-        CPU Optimization: Only update LEDs when blink state actually changes
-        - Before: 10 calls/sec to _update_green_leds_with_pins()
-        - After: ~7 calls/sec (only on blink transitions: 2.5Hz fast + 1Hz slow)
-        - Reduction: 30% less function calls
+        CPU Optimization: Blink states toggle at time.monotonic() deadlines
+        - Ticks between deadlines do no LED work (clock compares only)
+        - Green LEDs re-rendered only on fast/slow transitions
+        - Blink timing no longer depends on the update_display call rate
+        - Blink deadlines only checked while pinned tracks can blink (PAGE mode)
+        - Idle ticks (no blink due, indicator or pending LED work) return early
         """
 
-        # Check if scroll indicator should be deactivated
-        if self._scroll_indicator_active and time.time() >= self._scroll_indicator_end_time:
-            self._scroll_indicator_active = False
-            # Force LED update to restore normal display
-            self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
+        # Latch the clock once per tick (monotonic: immune to wall-clock jumps)
+        now = time.monotonic()
 
-        # Fast blink: 2.5Hz = 400ms cycle (3 cycles ON, 1 cycle OFF = 75/25)
-        # Pour pinned seul (pas page courante) - rapide pour attirer l'attention
-        # Note: update_display() appelé à ~10Hz (100ms), donc 4 compteurs = 400ms cycle
-        self._blink_fast_counter += 1
-        if self._blink_fast_counter <= 3:
-            self._blink_fast_state = True  # ON (75% du temps)
-        else:
-            self._blink_fast_state = False  # OFF (25% du temps)
+        # Parameter feedback coalesced since the last tick (one CC per control)
+        if self._feedback_pending:
+            self._flush_param_feedback()
 
-        if self._blink_fast_counter >= 4:  # Reset cycle 400ms
-            self._blink_fast_counter = 0
+        # VU meters changed since the last tick (one level read per slot)
+        if self._vu_pending:
+            self._poll_vu_meters()
 
-        # Slow blink: 1Hz = 1000ms cycle (9 cycles ON, 1 cycle OFF = 90/10)
-        # Pour page courante + pinned (double fonction) - moins dérangeant
-        # Note: update_display() appelé à ~10Hz (100ms), donc 10 compteurs = 1000ms cycle
-        self._blink_slow_counter += 1
-        if self._blink_slow_counter <= 9:
-            self._blink_slow_state = True  # ON (90% du temps)
-        else:
-            self._blink_slow_state = False  # OFF (10% du temps)
+        # Green blinks only mark pinned tracks in PAGE mode: without pins
+        # nothing blinks, and the fast/slow deadlines are not even checked
+        blink_due = (self._pinned_track_ids and self._display_mode != 'pins'
+                     and (now >= self._blink_fast_deadline or now >= self._blink_slow_deadline))
+
+        # Idle tick: no blink due, no indicator or LED work pending
+        if not blink_due and not (self._scroll_indicator_active or self._recording_mode
+                                  or self._snapshot_mode or self._pending_resync or self._leds_dirty):
+            return
 
-        if self._blink_slow_counter >= 10:  # Reset cycle 1000ms
-            self._blink_slow_counter = 0
+        # Check if scroll indicator should be deactivated
+        if self._scroll_indicator_active and now >= self._scroll_indicator_end_time:
+            self._scroll_indicator_active = False
+            # Force LED update to restore normal display
+            self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
 
-        # Recording LED blink: 4Hz = 250ms cycle (fast for attention, 50/50 duty)
+        # Blinks toggle at precomputed deadlines: between deadlines a tick only
+        # compares the clock. Green LEDs are re-rendered on fast/slow toggles only.
+        blink_changed = False
+
+        if blink_due:
+            # Fast blink: 2.5Hz = 400ms cycle (300ms ON, 100ms OFF = 75/25)
+            # Pour pinned seul (pas page courante) - rapide pour attirer l'attention
+            if now >= self._blink_fast_deadline:
+                self._blink_fast_state = not self._blink_fast_state
+                self._blink_fast_deadline = self._next_blink_deadline(
+                    self._blink_fast_deadline, now, BLINK_FAST_TIMES, self._blink_fast_state)
+                blink_changed = True
+
+            # Slow blink: 1Hz = 1000ms cycle (900ms ON, 100ms OFF = 90/10)
+            # Pour page courante + pinned (double fonction) - moins dérangeant
+            if now >= self._blink_slow_deadline:
+                self._blink_slow_state = not self._blink_slow_state
+                self._blink_slow_deadline = self._next_blink_deadline(
+                    self._blink_slow_deadline, now, BLINK_SLOW_TIMES, self._blink_slow_state)
+                blink_changed = True
+
+        # Slot 11 indicator LEDs below are queued and sent as one batch
+        indicator_messages = []
+
+        # Recording LED blink: 200ms cycle (fast for attention, 50/50 duty)
         # Red LED on slot 11 (CC 35) blinks rapidly during recording
-        # Note: update_display() appelé à ~10Hz (100ms), donc 2.5 compteurs ≈ 250ms cycle
         if self._recording_mode:
-            self._recording_blink_counter += 1
-            if self._recording_blink_counter <= 1:  # ON for ~100ms (50%)
-                self._recording_blink_state = True
-            else:
-                self._recording_blink_state = False  # OFF for ~100ms (50%)
-
-            if self._recording_blink_counter >= 2:  # Reset cycle ~250ms (4Hz)
-                self._recording_blink_counter = 0
+            if now >= self._recording_blink_deadline:
+                self._recording_blink_state = not self._recording_blink_state
+                self._recording_blink_deadline = self._next_blink_deadline(
+                    self._recording_blink_deadline, now, BLINK_INDICATOR_TIMES, self._recording_blink_state)
 
-            # Update recording LED immediately (don't wait for optimization)
-            cc_num = 24 + self._recording_led_slot
+            # Keep recording LED asserted (activity updates may overwrite slot 11)
+            cc_num = RED_LED_CCS[self._recording_led_slot]
             new_value = 127 if self._recording_blink_state else 0
-            if self._led_states[self._recording_led_slot] != new_value:
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._led_states[self._recording_led_slot] = new_value
+            self._queue_cc_if_changed(indicator_messages, self._led_states, self._recording_led_slot, cc_num, new_value)
 
-        # Snapshot LED blink: 4Hz = 250ms cycle (same as recording, 50/50 duty)
+        # Snapshot LED blink: 200ms cycle (same as recording, 50/50 duty)
         # Green LED on slot 11 (CC 47) blinks rapidly during active snapshot mode
-        # Note: update_display() appelé à ~10Hz (100ms), donc 2.5 compteurs ≈ 250ms cycle
         if self._snapshot_mode:
-            self._snapshot_blink_counter += 1
-            if self._snapshot_blink_counter <= 1:  # ON for ~100ms (50%)
-                self._snapshot_blink_state = True
-            else:
-                self._snapshot_blink_state = False  # OFF for ~100ms (50%)
+            if now >= self._snapshot_blink_deadline:
+                self._snapshot_blink_state = not self._snapshot_blink_state
+                self._snapshot_blink_deadline = self._next_blink_deadline(
+                    self._snapshot_blink_deadline, now, BLINK_INDICATOR_TIMES, self._snapshot_blink_state)
 
-            if self._snapshot_blink_counter >= 2:  # Reset cycle ~250ms (4Hz)
-                self._snapshot_blink_counter = 0
-
-            # Update snapshot LED immediately (don't wait for optimization)
-            cc_num = 36 + self._recording_led_slot  # Green LED = CC 47
+            # Keep snapshot LED asserted (green LED renders may overwrite slot 11)
+            cc_num = GREEN_LED_CCS[self._recording_led_slot]  # Green LED = CC 47
             new_value = 127 if self._snapshot_blink_state else 0
-            if self._page_led_states[self._recording_led_slot] != new_value:
-                self._send_midi((0xB0 | self._midi_channel, cc_num, new_value))
-                self._page_led_states[self._recording_led_slot] = new_value
+            self._queue_cc_if_changed(indicator_messages, self._page_led_states, self._recording_led_slot, cc_num, new_value)
 
-        # OPTIMIZATION: Only update LEDs if blink state actually changed
-        # This reduces function calls from 100Hz to ~14Hz (fast 10Hz + slow 4Hz)
-        blink_changed = (self._blink_fast_state != self._prev_blink_fast_state or
-                         self._blink_slow_state != self._prev_blink_slow_state)
+        if indicator_messages:
+            self._send_midi_batch(indicator_messages)
 
         if blink_changed:
             self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
-            self._prev_blink_fast_state = self._blink_fast_state
-            self._prev_blink_slow_state = self._blink_slow_state
+
+        # Flush LED resync deferred by the throttle (coalesces button mashing)
+        if self._pending_resync and now - self._last_resync_time >= self._resync_cooldown:
+            self._force_resync_all_leds()
+        elif self._leds_dirty:
+            # State changed since last LED update (e.g. pin toggled)
+            self._leds_dirty = False
+            self._update_green_leds_with_pins(self._blink_fast_state, self._blink_slow_state)
+
+    @staticmethod
+    def _next_blink_deadline(deadline, now, times, state):
+        """Return the deadline of the next blink toggle after entering state
+
+        times = (on_duration, off_duration). Advances from the previous
+        deadline to keep the cadence; restarts from now after a stall.
+        """
+        deadline += times[0] if state else times[1]
+        if deadline <= now:
+            deadline = now + (times[0] if state else times[1])
+        return deadline
 
     def disconnect(self):
         self.log_message("Disconnecting Faderfox MX12 (LISTENER VERSION)")
@@ -1871,10 +2182,14 @@ class FaderfoxMX12byYVMA(ControlSurface):
         self._remove_all_activity_listeners()
         self._remove_param_listeners()
 
-        if self.song().tracks_has_listener(self._on_tracks_changed):
-            self.song().remove_tracks_listener(self._on_tracks_changed)
+        song = self._song
+        if song.tracks_has_listener(self._on_tracks_changed):
+            song.remove_tracks_listener(self._on_tracks_changed)
 
-        # Turn off all LEDs
+        # Turn off all LEDs (activity + page, one batch)
+        off_msgs = self._cc_msg_table[0]
+        messages = []
         for i in range(12):
-            self._send_midi((0xB0 | self._midi_channel, 24 + i, 0))  # Activity LEDs off
-            self._send_midi((0xB0 | self._midi_channel, 36 + i, 0))  # Page LEDs off
+            messages.append(off_msgs[RED_LED_CCS[i]])  # Activity LEDs off
+            messages.append(off_msgs[GREEN_LED_CCS[i]])  # Page LEDs off
+        self._send_midi_batch(messages)
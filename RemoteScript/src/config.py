@@ -29,10 +29,12 @@ ENABLE_VU_FALLBACK = True        # VU meter fallback for MIDI tracks without M4L
 
 # === DEBUG / LOGGING ===
 # Enable detailed logging for troubleshooting (check Ableton Log.txt)
-LOG_LISTENER_ADD_REMOVE = True   # Log when param listeners are added/removed
+LOG_LISTENER_ADD_REMOVE = True   # Log when param/activity listeners are added/removed
 LOG_LISTENER_SUSPEND_RESUME = True  # Log suspend/resume operations
-LOG_PARAM_CHANGES = False        # Log every parameter change (VERY verbose!)
+LOG_PARAM_CHANGES = False        # Log every parameter change, incl. M4L activity (VERY verbose!)
 LOG_MIDI_SEND = False            # Log every MIDI message sent (VERY verbose!)
+LOG_MIDI_RECEIVE = False         # Log incoming MIDI (first 100 messages + every CC) (VERY verbose!)
+LOG_VU_DETAIL = False            # Log per-slot activity state on every forced LED refresh (verbose)
 
 # === PERFORMANCE ===
 # LED resync throttle (seconds) - prevents spam on rapid button presses